@@ -0,0 +1,147 @@
+# 이미지/폰트 캐시와 백그라운드 프리페치
+# SDL 텍스처 생성은 렌더러를 가진 메인 스레드에서만 안전하다.
+# 그래서 백그라운드 스레드는 이미지 파일을 SDL 서피스로 디코딩(IMG_Load)까지만 하고,
+# 메인 스레드가 매 프레임 pump() 에서 정해진 시간 예산만큼 서피스를 텍스처로 올린다.
+# 렌더러가 없거나(헤드리스) SDL_image 를 쓸 수 없으면 워커는 파일만 읽고 메인 스레드가 load_image 로 디코딩한다.
+import threading
+import time
+from collections import deque
+
+import pico2d
+
+try:
+    from sdl2 import SDL_CreateTextureFromSurface, SDL_FreeSurface
+    from sdl2.sdlimage import IMG_Load
+except ImportError:
+    IMG_Load = None
+
+PUMP_BUDGET = 0.002  # 일반 프레임에서 텍스처 생성에 쓸 최대 시간(초)
+
+_images = {}          # path -> image
+_fonts = {}           # (path, size) -> font
+_asset_keys = {}      # id(리소스) -> ("image", path) / ("font", path, size). 스냅샷이 리소스를 경로로 저장할 때 사용
+_upload_queue = deque()
+_queued = set()
+_read_queue = deque()
+_decoded = {}         # path -> 워커가 디코딩한 서피스 (파일만 읽었거나 디코딩에 실패했으면 None)
+_lock = threading.Lock()
+_worker = None
+
+
+def load_image(path):
+    image = _images.get(path)
+    if image is None:
+        with _lock:
+            surface = _decoded.pop(path, None)
+        image = _upload(path, surface) if surface else pico2d.load_image(path)
+        with _lock:
+            _images[path] = image
+        _asset_keys[id(image)] = ("image", path)
+    return image
+
+
+def _upload(path, surface):
+    texture = SDL_CreateTextureFromSurface(pico2d.renderer, surface)
+    SDL_FreeSurface(surface)
+    if not texture:
+        # 오류 보고는 pico2d 에 맡긴다.
+        return pico2d.load_image(path)
+    return pico2d.Image(texture)
+
+
+def load_font(path, size):
+    key = (path, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pico2d.load_font(path, size)
+        _fonts[key] = font
+        _asset_keys[id(font)] = ("font", path, size)
+    return font
+
+
+def asset_key(obj):
+    # 이 모듈이 로드한 리소스면 다시 로드할 수 있는 키를, 아니면 None 을 반환한다.
+    return _asset_keys.get(id(obj))
+
+
+def load_by_key(key):
+    if key[0] == "image":
+        return load_image(key[1])
+    if key[0] == "font":
+        return load_font(key[1], key[2])
+    raise ValueError(f"Unknown asset key: {key}")
+
+
+def prefetch(paths):
+    # 필요한 이미지를 백그라운드에서 디코딩하기 시작한다. 텍스처는 pump() 에서 조금씩 만든다.
+    global _worker
+    with _lock:
+        for path in paths:
+            if path in _images or path in _queued:
+                continue
+            _queued.add(path)
+            _upload_queue.append(path)
+            _read_queue.append(path)
+
+        if _read_queue and _worker is None:
+            decode = IMG_Load is not None and getattr(pico2d, "renderer", None) is not None
+            _worker = threading.Thread(target=_decode_files, args=(decode,), daemon=True)
+            _worker.start()
+
+
+def _decode_files(decode):
+    global _worker
+    while True:
+        with _lock:
+            if not _read_queue:
+                _worker = None
+                return
+            path = _read_queue.popleft()
+
+        surface = None
+        if decode:
+            surface = IMG_Load(path.encode("UTF-8")) or None
+        else:
+            try:
+                with open(path, "rb") as f:
+                    f.read()
+            except OSError:
+                # 실제 오류는 메인 스레드의 load_image 에서 보고된다.
+                pass
+
+        with _lock:
+            # 기다리지 못한 메인 스레드가 먼저 직접 로드했으면 서피스는 버린다.
+            loaded = path in _images
+            if not loaded:
+                _decoded[path] = surface
+        if loaded and surface:
+            SDL_FreeSurface(surface)
+
+
+def pump(budget=PUMP_BUDGET, force=False):
+    # 메인 스레드에서 호출. force 가 True 면 아직 디코딩되지 않은 파일도 바로 로드한다.
+    # 예산을 다 쓰면 다음 로드를 시작하지 않는다.
+    start = time.perf_counter()
+    while _upload_queue:
+        if time.perf_counter() - start >= budget:
+            break
+        path = _upload_queue[0]
+        with _lock:
+            ready = path in _decoded
+        if not (ready or force):
+            break
+
+        _upload_queue.popleft()
+        _queued.discard(path)
+        load_image(path)
+
+
+def is_ready(paths):
+    return all(path in _images for path in paths)
+
+
+def progress(paths):
+    paths = list(paths)
+    if not paths:
+        return 1.0
+    return sum(1 for path in paths if path in _images) / len(paths)
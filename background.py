@@ -2,40 +2,42 @@ import os
 import game_world
 from pico2d import *
 
-from common import resource_path
+import asset_loader
+from stage_definitions import get_background_path
 
 
 class Background:
-    _cache = {}
-
     def __init__(self, filename="bg1.png"):
-        image_path = resource_path(f'resource/Image/GUI/Stage/BackGround/{filename}')
-        if filename not in Background._cache:
-            Background._cache[filename] = load_image(image_path)
-        self.image = Background._cache[filename]
+        self.image = asset_loader.load_image(get_background_path(filename))
 
     def draw(self):
         self.image.draw(get_canvas_width()//2, get_canvas_height()//2, get_canvas_width(), get_canvas_height()*2)
 
     def draw_with_camera(self, camera):
-        cw = get_canvas_width()
-        ch = get_canvas_height()
+        bounds = camera.bounds
+        cw = bounds.view_w
+        ch = bounds.view_h
 
-        # 배경의 실제 렌더링 높이 (2배)
-        bg_h = ch * 2
+        # 배경 한 장의 크기 = 화면 너비 x 화면 높이 2배. 월드가 더 크면 같은 이미지를 타일처럼 반복한다.
+        tile_w = cw
+        tile_h = ch * 2
+        world_w, world_h = bounds.width, bounds.height
 
         # 카메라 offset
+        offset_x = int(camera.x)
         offset_y = int(camera.y)
 
-        # 배경의 중심 y = (배경 전체의 중앙) - offset
-        center_y = bg_h // 2 - offset_y
-
-        self.image.draw(
-            cw // 2,
-            center_y,
-            cw,
-            bg_h
-        )
+        # 화면에 걸치는 타일만 그린다.
+        first_col = max(0, offset_x // tile_w)
+        last_col = min((world_w - 1) // tile_w, (offset_x + cw) // tile_w)
+        first_row = max(0, offset_y // tile_h)
+        last_row = min((world_h - 1) // tile_h, (offset_y + ch) // tile_h)
+        for row in range(first_row, last_row + 1):
+            # 타일의 중심 y = (타일의 중앙) - offset
+            center_y = row * tile_h + tile_h // 2 - offset_y
+            for col in range(first_col, last_col + 1):
+                center_x = col * tile_w + tile_w // 2 - offset_x
+                self.image.draw(center_x, center_y, tile_w, tile_h)
 
     def update(self):
         pass
@@ -0,0 +1,64 @@
+# 여러 스테이지 시뮬레이션을 프로세스 풀에서 병렬로 돌리는 밸런스 스윕 도구
+# 사용법: python batch_runner.py --stage 2 --runs 16 --workers 8 --seed 100
+# 각 실행은 별도 프로세스에서 자신만의 World 를 가진다 (시간 간격은 World.dt).
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import simulate
+
+
+def _run(job):
+    stage, seconds, rate, seed = job
+    return simulate.run_stage(stage, seconds, rate, seed)
+
+
+def run_batch(stages, runs, seconds=600.0, rate=120, workers=None, seed=None):
+    # seed 를 주면 i 번째 실행은 seed + i 를 사용한다. 같은 명령이면 같은 결과가 나온다.
+    jobs = [(stage, seconds, rate, seed + i if seed is not None else None)
+            for stage in stages for i in range(runs)]
+    # 모듈 전역 상태(bgm, 프로파일러 등)가 실행 사이에 섞이지 않도록 작업마다 새 프로세스를 쓴다.
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+        return list(pool.map(_run, jobs))
+
+
+def summarize(results):
+    # stage 별 승률, 평균 클리어 시간, 평균 받은 피해
+    summary = {}
+    for result in results:
+        summary.setdefault(result["stage"], []).append(result)
+
+    lines = []
+    for stage, stage_results in sorted(summary.items()):
+        wins = [r for r in stage_results if r["result"] == "victory"]
+        clear_times = [r["time_to_clear"] for r in wins]
+        damage = [r["damage_taken"] for r in stage_results]
+        avg_clear = f"{sum(clear_times) / len(clear_times):.2f}s" if clear_times else "-"
+        lines.append(f"stage={stage} runs={len(stage_results)} "
+                     f"victory={len(wins)}/{len(stage_results)} "
+                     f"avg_time_to_clear={avg_clear} "
+                     f"avg_damage_taken={sum(damage) / len(damage):.1f}")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="헤드리스 스테이지 시뮬레이션을 여러 프로세스에서 병렬로 실행합니다.")
+    parser.add_argument("--stage", type=int, nargs="+", default=[1])
+    parser.add_argument("--runs", type=int, default=8, help="스테이지당 실행 횟수")
+    parser.add_argument("--seconds", type=float, default=600.0, help="실행당 최대 시뮬레이션 시간(초)")
+    parser.add_argument("--rate", type=int, default=120, help="초당 update 횟수")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, help="첫 실행의 난수 시드 (이후 실행은 1 씩 증가)")
+    args = parser.parse_args()
+
+    results = run_batch(args.stage, args.runs, args.seconds, args.rate, args.workers, args.seed)
+    for result in results:
+        clear = f"{result['time_to_clear']:.2f}s" if result["time_to_clear"] is not None else "-"
+        print(f"stage={result['stage']} seed={result['seed']} result={result['result']} "
+              f"time_to_clear={clear} damage_taken={result['damage_taken']}")
+    for line in summarize(results):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -22,12 +22,16 @@ class BehaviorTree:
     # 'MONITOR' : evaluate only condition nodes
     run_mode = 'EVAL'
 
+    # 노드 실행 로그 출력 여부 (헤드리스 시뮬레이션에서는 꺼서 속도를 확보)
+    verbose = True
+
     def __init__(self, root_node):
         self.root = root_node
         self.root.tag_condition()
 
     def run(self):
-        print('\n========================================== NEW TICK =======================================================')
+        if BehaviorTree.verbose:
+            print('\n========================================== NEW TICK =======================================================')
         self.root.run()
         if self.root.value == BehaviorTree.SUCCESS:
             self.root.reset()
@@ -44,7 +48,8 @@ class Node:
     def show_result(f):
         def inner(self):
             result = f(self)
-            print(f'[{self.__class__.__name__:10s}] {self.name:40s} ==> ({result})')
+            if BehaviorTree.verbose:
+                print(f'[{self.__class__.__name__:10s}] {self.name:40s} ==> ({result})')
             return result
 
         return inner
@@ -79,7 +84,8 @@ class Selector(Node):
     @Node.show_result
     def run(self):
         for i, child in enumerate(self.children):
-            print(i, child.value, child.has_condition)
+            if BehaviorTree.verbose:
+                print(i, child.value, child.has_condition)
             if (child.value in (BehaviorTree.UNDEF, BehaviorTree.RUNNING)) or child.has_condition:
                 self.value = child.run()
                 if self.value in (BehaviorTree.RUNNING, BehaviorTree.SUCCESS):
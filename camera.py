@@ -1,21 +1,40 @@
-from pico2d import get_canvas_width, get_canvas_height, clamp
+from pico2d import clamp
 
 class Camera:
-    def __init__(self, world_width, world_height):
+    def __init__(self, bounds):
         self.x = 0
         self.y = 0
-        self.world_w = world_width
-        self.world_h = world_height
+        # 고정 스텝 시작 시점의 위치 (그릴 때 엔티티와 같은 alpha 로 보간한다)
+        self.prev_x = 0
+        self.prev_y = 0
+        self.placed = False
+        # 월드의 WorldBounds (화면 크기와 월드 크기)
+        self.bounds = bounds
 
-    def update(self, target):
-        cw = get_canvas_width()
-        ch = get_canvas_height()
+    def store_previous(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def interpolated(self, alpha):
+        return (
+            self.prev_x + (self.x - self.prev_x) * alpha,
+            self.prev_y + (self.y - self.prev_y) * alpha,
+        )
 
-        # 배경의 실제 월드 높이 = ch * 2
-        world_h = ch * 2
+    def update(self, target):
+        cw = self.bounds.view_w
+        ch = self.bounds.view_h
+        world_w = self.bounds.width
+        world_h = self.bounds.height
 
+        self.x = target.x - cw // 2
         self.y = target.y - ch // 2
 
-        # 카메라가 배경 밖으로 나가지 않게 제한
+        # 카메라가 월드 밖으로 나가지 않게 제한
+        self.x = clamp(0, self.x, max(0, world_w - cw))
         self.y = clamp(0, self.y, world_h - ch)
 
+        if not self.placed:
+            # 처음 위치를 잡을 때는 (0, 0) 에서 미끄러져 오지 않게 바로 그 자리에 둔다.
+            self.placed = True
+            self.store_previous()
@@ -0,0 +1,125 @@
+# 청크 스트리밍
+# 월드를 chunk_w x chunk_h 칸으로 나누고, 카메라가 걸친 칸과 그 주변 margin 칸만 활성 상태로 둔다.
+# 활성 영역 밖의 몬스터는 상태(__dict__)를 pickle 해서 칸별로 보관하고 월드에서 내린다 (사망 이벤트 없음, 살아 있는 수는 그대로).
+# 객체 자체는 빈 껍데기로 남겨 두었다가, 카메라가 다시 가까워지면 같은 객체에 상태를 되돌려 월드에 돌려놓는다.
+# 그래서 다른 곳(play_mode.monsters, 공격 판정 목록, 투사체의 목표 등)이 들고 있는 참조는 계속 같은 엔티티를 가리킨다.
+# 그래서 스테이지가 길어져도 메모리에 올라와 update 되는 엔티티 수는 화면 주변만큼으로 유지된다.
+import io
+import pickle
+import zlib
+
+import snapshot
+from collision_manager import CollisionGroup
+
+STREAMED_GROUPS = (CollisionGroup.MONSTER,)
+COMPRESS_LEVEL = 1
+
+
+class _EntityPickler(snapshot.AssetPickler):
+    # 월드, 내리는 엔티티 자신, 월드에 남아 있는 다른 엔티티(추적 대상 플레이어 등)는 내용 대신 참조로 저장한다.
+    def __init__(self, file, world, root):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.world = world
+        self.root = root
+
+    def persistent_id(self, obj):
+        if obj is self.world:
+            return ("world",)
+        if obj is self.root:
+            return ("root",)
+        if self.world.contains(obj):
+            return ("entity", obj.entity_id)
+        return super().persistent_id(obj)
+
+
+class _EntityUnpickler(snapshot.AssetUnpickler):
+    def __init__(self, file, world, root):
+        super().__init__(file)
+        self.world = world
+        self.root = root
+
+    def persistent_load(self, key):
+        if key[0] == "world":
+            return self.world
+        if key[0] == "root":
+            return self.root
+        if key[0] == "entity":
+            # 보관하는 동안 사라진 엔티티면 None
+            return self.world.get_entity(key[1])
+        return super().persistent_load(key)
+
+
+class ChunkStreamer:
+    def __init__(self, world, chunk_size=None, margin=1):
+        self.world = world
+        self.chunk_w, self.chunk_h = chunk_size or (world.bounds.view_w, world.bounds.view_h)
+        self.margin = margin
+        self._chunks = {}    # (col, row) -> [(depth, 엔티티 껍데기, blob), ...]
+        self._active = None  # (first_col, last_col, first_row, last_row)
+        self.unloaded_total = 0
+        self.loaded_total = 0
+
+    def chunk_of(self, x, y):
+        return int(x // self.chunk_w), int(y // self.chunk_h)
+
+    def stored_count(self):
+        return sum(len(entries) for entries in self._chunks.values())
+
+    def update(self, camera):
+        active = self._active_range(camera)
+        if active != self._active:
+            self._active = active
+            self._load_range(active)
+        self._unload_outside(active)
+
+    def _active_range(self, camera):
+        first_col, first_row = self.chunk_of(camera.x, camera.y)
+        bounds = self.world.bounds
+        last_col, last_row = self.chunk_of(camera.x + bounds.view_w - 1, camera.y + bounds.view_h - 1)
+        m = self.margin
+        return first_col - m, last_col + m, first_row - m, last_row + m
+
+    def _unload_outside(self, active):
+        first_col, last_col, first_row, last_row = active
+        leaving = []
+        for group in STREAMED_GROUPS:
+            for o in self.world.group_objects[group]:
+                tr = getattr(o, "transform", None)
+                # 제거 대기 중(active False)인 엔티티는 그대로 둔다.
+                if tr is None or not getattr(o, "active", True):
+                    continue
+                col, row = self.chunk_of(tr.x, tr.y)
+                if not (first_col <= col <= last_col and first_row <= row <= last_row):
+                    leaving.append((o, (col, row)))
+        for o, key in leaving:
+            self._unload(o, key)
+
+    def _unload(self, o, key):
+        depth = self.world.unload_object(o)
+        buffer = io.BytesIO()
+        _EntityPickler(buffer, self.world, o).dump(o.__dict__)
+        blob = zlib.compress(buffer.getvalue(), COMPRESS_LEVEL)
+        # 상태는 blob 에만 두고, 껍데기는 다른 참조가 건드려도 비활성으로 보이게 한다.
+        o.__dict__.clear()
+        o.active = False
+        o.entity_id = None
+        self._chunks.setdefault(key, []).append((depth, o, blob))
+        self.unloaded_total += 1
+
+    def _load_range(self, active):
+        first_col, last_col, first_row, last_row = active
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                for depth, o, blob in self._chunks.pop((col, row), ()):
+                    self._load(depth, o, blob)
+
+    def _load(self, depth, o, blob):
+        state = _EntityUnpickler(io.BytesIO(zlib.decompress(blob)), self.world, o).load()
+        o.__dict__.clear()
+        o.__dict__.update(state)
+        self.world.reload_object(o, depth)
+        self.loaded_total += 1
+
+    def clear(self):
+        self._chunks.clear()
+        self._active = None
@@ -0,0 +1,104 @@
+# 브로드페이즈 일치 검사
+# 무작위로 움직이는 충돌체(투사체 일부는 continuous)를 같은 시드로 만들어 브로드페이즈마다 충돌 콜백을 기록하고,
+# 모든 브로드페이즈의 기록이 같은지 비교한다. continuous 가 아닌 몬스터/플레이어도 매 스텝 움직이고,
+# handle_collision 은 넉백처럼 받는 쪽을 밀어내서 콜백 중 위치가 바뀌는 경우도 검사한다.
+# 사용법: python collision_check.py --count 300 --seeds 10 --steps 3 --move 30 --knockback 20
+import argparse
+import random
+import sys
+
+import headless
+
+# handle_collision 은 넉백을 하므로 따로 정의한다.
+CALLBACKS = ("on_collision_enter", "on_collision_stay", "on_collision_exit")
+
+
+def run_backend(broadphase, seed, count, steps, move, knockback):
+    # 한 브로드페이즈로 충돌체 count 개를 steps 스텝 움직이며 (스텝, 콜백, 받는 쪽 번호, 상대 번호) 목록을 만든다.
+    from collision_manager import CollisionGroup, CollisionManager
+    from components.component_collision import CollisionComponent
+    from components.component_transform import TransformComponent
+    from game_object import GameObject
+
+    log = []
+
+    class Collider(GameObject):
+        def __init__(self, number, x, y, size, group, mask, continuous):
+            super().__init__()
+            self.number = number
+            self.transform = self.add_component(TransformComponent(x, y, size, size))
+            self.add_component(CollisionComponent(group, mask, continuous=continuous))
+
+    def recorder(callback):
+        def handler(self, other):
+            log.append((step, callback, self.number, other.number))
+        return handler
+
+    for callback in CALLBACKS:
+        setattr(Collider, callback, recorder(callback))
+
+    def knocked_back(self, other):
+        log.append((step, "handle_collision", self.number, other.number))
+        self.transform.x += knockback if self.transform.x >= other.transform.x else -knockback
+
+    Collider.handle_collision = knocked_back
+
+    kinds = (
+        (CollisionGroup.PLAYER, CollisionGroup.MONSTER),
+        (CollisionGroup.MONSTER, CollisionGroup.PLAYER | CollisionGroup.PROJECTILE),
+        (CollisionGroup.PROJECTILE, CollisionGroup.MONSTER),
+    )
+    rng = random.Random(seed)
+    colliders = []
+    for number in range(count):
+        group, mask = rng.choice(kinds)
+        continuous = group == CollisionGroup.PROJECTILE and rng.random() < 0.5
+        colliders.append(Collider(number, rng.uniform(0, 1600), rng.uniform(0, 900), rng.uniform(10, 60),
+                                  group, mask, continuous))
+
+    manager = CollisionManager(broadphase)
+    for collider in colliders:
+        manager.register(collider)
+
+    step = 0
+    for step in range(steps):
+        for collider in colliders:
+            tr = collider.transform
+            tr.store_previous()
+            tr.x += rng.uniform(-move, move) * (4 if collider.get(CollisionComponent).continuous else 1)
+            tr.y += rng.uniform(-move, move)
+        manager.handle_collisions()
+    return log
+
+
+def main():
+    parser = argparse.ArgumentParser(description="브로드페이즈마다 충돌 콜백이 같은지 비교합니다.")
+    parser.add_argument("--count", type=int, default=300, help="충돌체 수")
+    parser.add_argument("--seeds", type=int, default=10, help="검사할 시드 수 (0 부터)")
+    parser.add_argument("--steps", type=int, default=3, help="시드마다 진행할 스텝 수")
+    parser.add_argument("--move", type=float, default=30.0, help="스텝당 최대 이동 거리 (continuous 는 4배)")
+    parser.add_argument("--knockback", type=float, default=20.0, help="handle_collision 에서 밀려나는 거리")
+    args = parser.parse_args()
+
+    headless.install()
+
+    import collision_manager
+
+    broadphases = [mode for mode in collision_manager.BROADPHASES
+                   if mode != collision_manager.NUMPY or collision_manager.NUMPY_AVAILABLE]
+    failed = 0
+    for seed in range(args.seeds):
+        logs = {mode: run_backend(mode, seed, args.count, args.steps, args.move, args.knockback) for mode in broadphases}
+        reference = logs[broadphases[0]]
+        different = [mode for mode in broadphases[1:] if logs[mode] != reference]
+        if different:
+            failed += 1
+        print(f"seed={seed} events={len(reference)} "
+              f"{'mismatch: ' + ', '.join(different) if different else 'ok'}")
+
+    print(f"{args.seeds - failed}/{args.seeds} seeds match across {', '.join(broadphases)}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
 from enum import IntFlag
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from components.component_collision import CollisionComponent
+from components.component_transform import TransformComponent
+from entity_registry import PackedList
 
 
 class CollisionGroup(IntFlag):
@@ -9,9 +16,50 @@ class CollisionGroup(IntFlag):
     PROJECTILE = 4
 
 
+# 브로드페이즈 방식
+# SPATIAL_HASH: 매 프레임 충돌 박스를 cell_size 격자에 넣고 같은 칸에 있는 쌍만 검사한다.
+# BRUTE_FORCE: 모든 쌍을 검사하는 기존 방식 (A/B 비교용)
+# NUMPY: 충돌 박스를 배열로 모아 버킷 쌍마다 브로드캐스팅으로 한꺼번에 겹침 검사 (NumPy 가 없으면 SPATIAL_HASH)
+#        월드가 TransformStore 를 쓰면 박스를 저장소 배열에서 바로 계산한다.
+SPATIAL_HASH = "spatial_hash"
+BRUTE_FORCE = "brute_force"
+NUMPY = "numpy"
+BROADPHASES = (SPATIAL_HASH, BRUTE_FORCE, NUMPY)
+NUMPY_AVAILABLE = np is not None
+DEFAULT_CELL_SIZE = 128
+NUMPY_BLOCK_ROWS = 1024  # 브로드캐스팅 비교 행렬이 너무 커지지 않게 한 번에 비교할 행 수
+
+# 새로 만드는 CollisionManager 의 기본 설정 (명령줄 등에서 바꾼다)
+default_broadphase = SPATIAL_HASH
+default_cell_size = DEFAULT_CELL_SIZE
+
+
+def set_default_broadphase(mode, cell_size=None):
+    global default_broadphase, default_cell_size
+    if mode not in BROADPHASES:
+        raise ValueError(f"Unknown broadphase: {mode}")
+    default_broadphase = mode
+    if cell_size:
+        default_cell_size = cell_size
+
+
 class CollisionManager:
-    def __init__(self):
-        self.components = []
+    # 컴포넌트를 (group, mask) 버킷으로 나누고, 마스크가 서로 허용하는 버킷 쌍만 교차 검사한다.
+    # 그래서 몬스터끼리, 투사체끼리처럼 마스크가 막는 쌍은 아예 순회하지 않는다.
+    def __init__(self, broadphase=None, cell_size=None, transforms=None):
+        self.components = PackedList()  # 슬롯 인덱스 (처리 순서를 정하는 데 쓴다). 해제 시 swap-and-pop 이라 등록 순서와는 다를 수 있다
+        self._buckets = {}               # (group, mask) -> PackedList
+        self._bucket_pairs = []          # 서로 충돌할 수 있는 (버킷 키, 버킷 키) 목록
+        self._paired_keys = set()        # 어떤 쌍에든 들어 있는 버킷 키
+        self.broadphase = broadphase or default_broadphase
+        self.cell_size = cell_size or default_cell_size
+        self.transforms = transforms     # 월드의 TransformStore (없으면 None)
+        # NUMPY 브로드페이즈용 버킷별 모양: 버킷 키 -> (컴포넌트 목록, 저장소 행, 오프셋, 고정 크기, continuous)
+        self._shapes = {}
+        # 직전 충돌 처리에서 겹쳐 있던 쌍: frozenset({comp_a, comp_b}) -> (comp_a, comp_b)
+        self._contacts = {}
+        # 컴포넌트 -> 그 컴포넌트가 낀 접촉 키 집합 (unregister 가 전체 접촉을 훑지 않게 한다)
+        self._contact_keys = {}
 
     def register(self, obj):
         getter = getattr(obj, "get", None)
@@ -21,6 +69,8 @@ class CollisionManager:
         component = getter(CollisionComponent)
         if component and component not in self.components:
             self.components.append(component)
+            self._add_to_bucket(component, component.mask)
+            component._manager = self
 
     def unregister(self, obj):
         getter = getattr(obj, "get", None)
@@ -28,33 +78,263 @@ class CollisionManager:
             return
 
         component = getter(CollisionComponent)
-        if component and component in self.components:
-            self.components.remove(component)
+        if component and self.components.remove(component):
+            self._buckets[(component.group, component.mask)].remove(component)
+            self._shapes.pop((component.group, component.mask), None)
+            component._manager = None
+            self._end_contacts(component)
+
+    def _end_contacts(self, component):
+        # 빠지는 컴포넌트가 낀 접촉을 바로 끝내고 양쪽에 on_collision_exit 를 보낸다.
+        # 풀에서 같은 컴포넌트가 다시 나와도 예전 접촉이 남아 있지 않아 첫 충돌에 enter 를 받는다.
+        for key in self._contact_keys.pop(component, ()):
+            comp_a, comp_b = self._contacts.pop(key)
+            other = comp_b if comp_a is component else comp_a
+            self._unlink_contact(other, key)
+            owner_a, owner_b = comp_a.owner, comp_b.owner
+            if owner_a is not None and owner_b is not None:
+                _notify(owner_a, "on_collision_exit", owner_b)
+                _notify(owner_b, "on_collision_exit", owner_a)
+
+    def _link_contact(self, component, key):
+        self._contact_keys.setdefault(component, set()).add(key)
+
+    def _unlink_contact(self, component, key):
+        keys = self._contact_keys.get(component)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._contact_keys[component]
+
+    def rebucket(self, component, old_mask):
+        # CollisionComponent.mask 가 바뀌면 호출된다 (예: SlimeKing 점프 중 mask = 0).
+        self._buckets[(component.group, old_mask)].remove(component)
+        self._shapes.pop((component.group, old_mask), None)
+        self._add_to_bucket(component, component.mask)
+
+    def reshape(self, component):
+        # CollisionComponent 의 오프셋/고정 크기가 바뀌면 호출된다 (예: Goblin 공격 중 히트박스 확장).
+        self._shapes.pop((component.group, component.mask), None)
+
+    def _add_to_bucket(self, component, mask):
+        key = (component.group, mask)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = PackedList()
+            # 새 버킷과 기존 버킷(자기 자신 포함) 사이의 허용 여부는 여기서 한 번만 계산한다.
+            for other in self._buckets:
+                other_group, other_mask = other
+                if mask & other_group and other_mask & component.group:
+                    self._bucket_pairs.append((key, other))
+                    self._paired_keys.update((key, other))
+        bucket.append(component)
+        self._shapes.pop(key, None)
 
     def clear(self):
+        for component in self.components:
+            component._manager = None
         self.components.clear()
+        for bucket in self._buckets.values():
+            bucket.clear()
+        self._shapes.clear()
+        self._contacts.clear()
+        self._contact_keys.clear()
 
     def handle_collisions(self):
-        for i, comp_a in enumerate(self.components):
-            owner_a = comp_a.owner
-            if not owner_a:
+        # 충돌 중 제거 요청은 World 가 스텝 끝까지 미루므로 목록은 바뀌지 않는다.
+        # 제거 대기 중인 객체(active 가 False)는 더 이상 충돌하지 않는다.
+        # 겹침은 모든 브로드페이즈에서 콜백을 보내기 전 위치로 한 번에 정한다 (_find_pairs).
+        # 그래서 앞선 콜백이 객체를 옮겨도(넉백 등) 이번 처리의 나머지 쌍 결과는 바뀌지 않는다.
+        # 겹친 쌍마다 처음 닿은 프레임이면 on_collision_enter, 계속 닿아 있으면 on_collision_stay 를 보내고
+        # handle_collision 은 기존처럼 겹쳐 있는 매 프레임 호출한다. 떨어진 쌍은 on_collision_exit 를 받는다.
+        previous = self._contacts
+        current = {}
+        for comp_a, comp_b in self._find_pairs():
+            key = frozenset((comp_a, comp_b))
+            if key in previous:
+                callback = "on_collision_stay"
+            else:
+                callback = "on_collision_enter"
+                self._link_contact(comp_a, key)
+                self._link_contact(comp_b, key)
+            current[key] = (comp_a, comp_b)
+
+            owner_a, owner_b = comp_a.owner, comp_b.owner
+            _notify(owner_a, callback, owner_b)
+            _notify(owner_b, callback, owner_a)
+            _notify(owner_a, "handle_collision", owner_b)
+            _notify(owner_b, "handle_collision", owner_a)
+        self._contacts = current
+
+        # 월드에서 빠진 컴포넌트의 접촉은 unregister 에서 이미 끝냈으므로 여기 남은 쌍은 둘 다 등록되어 있다.
+        for key, (comp_a, comp_b) in previous.items():
+            if key in current:
                 continue
-            for comp_b in self.components[i + 1 :]:
-                owner_b = comp_b.owner
-                if not owner_b:
-                    continue
+            self._unlink_contact(comp_a, key)
+            self._unlink_contact(comp_b, key)
+            _notify(comp_a.owner, "on_collision_exit", comp_b.owner)
+            _notify(comp_b.owner, "on_collision_exit", comp_a.owner)
+
+    def _find_pairs(self):
+        # 실제로 겹친 (comp_a, comp_b) 를 낸다. 겹침 검사는 첫 쌍을 내기 전에 모두 끝낸다.
+        # NUMPY 가 확정한 쌍(continuous 가 아닌 쌍)은 _collide 를 다시 하지 않는다.
+        if self.broadphase == NUMPY and NUMPY_AVAILABLE:
+            candidates = self._numpy_pairs()
+        else:
+            pairs = self._brute_force_pairs() if self.broadphase == BRUTE_FORCE else self._spatial_hash_pairs()
+            candidates = [(i, j, False) for i, j in pairs]
+        # components 의 슬롯 인덱스 (i, j) 순으로 처리해서 브로드페이즈가 달라도 결과가 같게 한다.
+        # 해제가 있었으면 슬롯 순서는 등록 순서가 아니지만, 모든 브로드페이즈가 같은 슬롯을 보므로 순서는 같다.
+        components = self.components.items
+        collide = self._collide
+        contacts = []
+        for i, j, hit in sorted(candidates):
+            comp_a, comp_b = components[i], components[j]
+            if hit or collide(comp_a, comp_b):
+                contacts.append((comp_a, comp_b))
+        # 앞선 콜백에서 제거 요청된(active 가 False) 객체는 건너뛴다.
+        for comp_a, comp_b in contacts:
+            owner_a, owner_b = comp_a.owner, comp_b.owner
+            if owner_a and owner_a.active and owner_b and owner_b.active:
+                yield comp_a, comp_b
+
+    def _live_indices(self, key):
+        index = self.components.index
+        return [index(comp) for comp in self._buckets[key] if comp.owner and comp.owner.active]
+
+    def _brute_force_pairs(self):
+        live = {key: self._live_indices(key) for key in self._paired_keys}
+        candidates = []
+        for key_a, key_b in self._bucket_pairs:
+            indices_a = live[key_a]
+            if key_a == key_b:
+                for n, i in enumerate(indices_a):
+                    for j in indices_a[n + 1 :]:
+                        candidates.append((i, j) if i < j else (j, i))
+            else:
+                for i in indices_a:
+                    for j in live[key_b]:
+                        candidates.append((i, j) if i < j else (j, i))
+        return candidates
 
-                if not (comp_a.mask & comp_b.group and comp_b.mask & comp_a.group):
+    def _spatial_hash_pairs(self):
+        # 버킷마다 cell_size 격자를 만들고, 허용된 버킷 쌍끼리 같은 칸에 있는 것만 후보로 낸다.
+        cell_size = self.cell_size
+        components = self.components.items
+        grids = {}  # 버킷 키 -> {(cx, cy): [인덱스, ...]}
+        for key in self._paired_keys:
+            grid = {}
+            for i in self._live_indices(key):
+                left, bottom, right, top = components[i].get_broadphase_bb()
+                x0, x1 = int(left // cell_size), int(right // cell_size)
+                y0, y1 = int(bottom // cell_size), int(top // cell_size)
+                for cx in range(x0, x1 + 1):
+                    for cy in range(y0, y1 + 1):
+                        grid.setdefault((cx, cy), []).append(i)
+            grids[key] = grid
+
+        # 여러 칸에 걸친 쌍은 한 번만 낸다.
+        candidates = set()
+        for key_a, key_b in self._bucket_pairs:
+            grid_a, grid_b = grids[key_a], grids[key_b]
+            if not grid_a or not grid_b:
+                continue
+            if key_a == key_b:
+                for indices in grid_a.values():
+                    for n, i in enumerate(indices):
+                        for j in indices[n + 1 :]:
+                            candidates.add((i, j) if i < j else (j, i))
+                continue
+            if len(grid_a) > len(grid_b):
+                grid_a, grid_b = grid_b, grid_a
+            for cell, indices_a in grid_a.items():
+                indices_b = grid_b.get(cell)
+                if not indices_b:
                     continue
+                for i in indices_a:
+                    for j in indices_b:
+                        candidates.add((i, j) if i < j else (j, i))
+        return candidates
+
+    def _numpy_pairs(self):
+        # 버킷별 충돌 박스를 (n, 4) 배열로 모으고, 허용된 버킷 쌍마다 겹치는 쌍을 한 번에 구한다.
+        # 제거 대기 중인 객체도 배열에 들어가지만 _find_pairs 가 걸러 낸다.
+        # continuous 쌍은 스윕 박스끼리 겹친 것뿐이라 확정하지 않고 _sweep_collide 로 넘긴다.
+        index = self.components.index
+        boxes = {}  # 버킷 키 -> (등록 인덱스 배열, (n, 4) 박스 배열, continuous 배열)
+        for key in self._paired_keys:
+            if self._buckets[key]:
+                comps, bbs, continuous = self._bucket_boxes(key)
+                indices = np.fromiter(map(index, comps), dtype=np.intp, count=len(comps))
+                boxes[key] = (indices, bbs, continuous)
+
+        candidates = []
+        for key_a, key_b in self._bucket_pairs:
+            if key_a not in boxes or key_b not in boxes:
+                continue
+            indices_a, bbs_a, continuous_a = boxes[key_a]
+            indices_b, bbs_b, continuous_b = boxes[key_b]
+            left_b, bottom_b, right_b, top_b = bbs_b[:, 0], bbs_b[:, 1], bbs_b[:, 2], bbs_b[:, 3]
+            for start in range(0, len(bbs_a), NUMPY_BLOCK_ROWS):
+                block = bbs_a[start:start + NUMPY_BLOCK_ROWS]
+                hit = (
+                    (block[:, 0:1] <= right_b)
+                    & (block[:, 2:3] >= left_b)
+                    & (block[:, 1:2] <= top_b)
+                    & (block[:, 3:4] >= bottom_b)
+                )
+                if key_a == key_b:
+                    # 같은 버킷끼리는 자기 자신과 중복 쌍을 뺀다.
+                    hit = np.triu(hit, start + 1)
+                rows, cols = np.nonzero(hit)
+                rows += start
+                i = indices_a[rows]
+                j = indices_b[cols]
+                confirmed = ~(continuous_a[rows] | continuous_b[cols])
+                candidates.extend(zip(np.minimum(i, j).tolist(), np.maximum(i, j).tolist(), confirmed.tolist()))
+        return candidates
+
+    def _bucket_boxes(self, key):
+        comps, rows, offsets, sizes, continuous = self._bucket_shape(key)
+        if rows is None:
+            bbs = np.array([comp.get_broadphase_bb() for comp in comps], dtype=np.float64)
+            return comps, bbs, continuous
+
+        # CollisionComponent._bb_at 과 같은 계산을 저장소 배열로 한다.
+        store = self.transforms
+        half = np.where(sizes != 0, sizes, np.column_stack((store.w[rows], store.h[rows]))) * 0.5
+        center = np.column_stack((store.x[rows], store.y[rows])) + offsets
+        bbs = np.hstack((center - half, center + half))
+        if continuous.any():
+            prev = np.column_stack((store.prev_x[rows], store.prev_y[rows]))[continuous] + offsets[continuous]
+            half = half[continuous]
+            bbs[continuous, :2] = np.minimum(bbs[continuous, :2], prev - half)
+            bbs[continuous, 2:] = np.maximum(bbs[continuous, 2:], prev + half)
+        return comps, bbs, continuous
+
+    def _bucket_shape(self, key):
+        # 버킷 구성이나 박스 모양이 바뀔 때만 다시 만든다.
+        shape = self._shapes.get(key)
+        if shape is not None:
+            return shape
 
-                if self._collide(comp_a, comp_b):
-                    if hasattr(owner_a, "handle_collision"):
-                        owner_a.handle_collision(owner_b)
-                    if hasattr(owner_b, "handle_collision"):
-                        owner_b.handle_collision(owner_a)
+        comps = list(self._buckets[key])
+        rows = None
+        if self.transforms is not None:
+            rows = [getattr(comp.owner.get(TransformComponent), "_row", None) for comp in comps]
+            # 저장소에 붙지 않은 Transform 이 하나라도 있으면 그 버킷은 get_bb() 로 모은다.
+            rows = None if None in rows else np.array(rows, dtype=np.intp)
+        offsets = np.array([(comp.offset_x, comp.offset_y) for comp in comps], dtype=np.float64)
+        sizes = np.array([(comp.override_width or 0, comp.override_height or 0) for comp in comps], dtype=np.float64)
+        continuous = np.array([comp.continuous for comp in comps], dtype=bool)
+        shape = self._shapes[key] = (comps, rows, offsets, sizes, continuous)
+        return shape
 
     @staticmethod
     def _collide(a, b):
+        if a.continuous or b.continuous:
+            return CollisionManager._sweep_collide(a, b)
+
         left_a, bottom_a, right_a, top_a = a.get_bb()
         left_b, bottom_b, right_b, top_b = b.get_bb()
 
@@ -68,5 +348,42 @@ class CollisionManager:
             return False
         return True
 
+    @staticmethod
+    def _sweep_collide(a, b):
+        # 스윕 AABB: 스텝 시작 박스와 이번 스텝 이동량으로, b 에 대한 a 의 상대 이동 중 겹치는 시각 t (0~1)가 있는지 본다.
+        # 끝 위치에서 겹치는 경우(t = 1)도 포함하므로 일반 검사에서 맞는 쌍은 여기서도 맞는다.
+        # continuous 가 아닌 쪽은 현재 박스에 멈춰 있다고 본다. 브로드페이즈도 그쪽은 현재 박스만 쓰므로
+        # 어떤 브로드페이즈로 후보를 찾아도 맞는 쌍이 같다.
+        left_a, bottom_a, right_a, top_a = _sweep_start(a)
+        left_b, bottom_b, right_b, top_b = _sweep_start(b)
+        dx_a, dy_a = a.get_displacement() if a.continuous else (0.0, 0.0)
+        dx_b, dy_b = b.get_displacement() if b.continuous else (0.0, 0.0)
+
+        t_enter, t_exit = 0.0, 1.0
+        for min_a, max_a, min_b, max_b, v in (
+            (left_a, right_a, left_b, right_b, dx_a - dx_b),
+            (bottom_a, top_a, bottom_b, top_b, dy_a - dy_b),
+        ):
+            if v == 0:
+                if min_a > max_b or max_a < min_b:
+                    return False
+                continue
+            t0 = (min_b - max_a) / v
+            t1 = (max_b - min_a) / v
+            if t0 > t1:
+                t0, t1 = t1, t0
+            t_enter = max(t_enter, t0)
+            t_exit = min(t_exit, t1)
+            if t_enter > t_exit:
+                return False
+        return True
+
+
+def _sweep_start(component):
+    return component.get_prev_bb() if component.continuous else component.get_bb()
+
 
-collision_manager = CollisionManager()
+def _notify(owner, callback, other):
+    handler = getattr(owner, callback, None)
+    if handler is not None:
+        handler(other)
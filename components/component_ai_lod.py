@@ -0,0 +1,57 @@
+from components.component_base import Component
+from components.component_transform import TransformComponent
+
+# AI LOD 단계
+NEAR = 0  # 매 스텝 update
+MID = 1   # mid_interval 스텝마다 한 번, 밀린 시간을 모아서 update
+FAR = 2   # update 하지 않음 (정지)
+
+MID_INTERVAL = 4
+
+
+class AILodComponent(Component):
+    # 플레이어와의 거리로 몬스터 AI 의 update 빈도를 정한다. World.step() 이 update 전에 tick() 을 호출한다.
+    def __init__(self, near, far, mid_interval=MID_INTERVAL):
+        super().__init__()
+        self.near = near
+        self.far = far
+        self.mid_interval = mid_interval
+        self.tier = NEAR
+        self.pending_dt = 0.0
+        self.pending_steps = 0
+
+    def classify(self, target):
+        tr = self.owner.get(TransformComponent)
+        target_tr = getattr(target, "transform", None)
+        if tr is None or target_tr is None:
+            return NEAR
+
+        dx = tr.x - target_tr.x
+        dy = tr.y - target_tr.y
+        distance_sq = dx * dx + dy * dy
+        if distance_sq <= self.near * self.near:
+            return NEAR
+        if distance_sq <= self.far * self.far:
+            return MID
+        return FAR
+
+    def tick(self, target, dt):
+        # 이번 스텝에 update 해야 하면 넘겨줄 dt 를, 건너뛰어야 하면 None 을 반환한다.
+        self.tier = self.classify(target)
+        self.pending_dt += dt
+        self.pending_steps += 1
+
+        # 죽은 몬스터는 거리와 관계없이 update 해서 제거 처리가 늦어지지 않게 한다.
+        dead = getattr(self.owner, "hp", 1) <= 0
+        if self.tier == FAR and not dead:
+            # 정지 상태의 시간은 버린다. 다시 가까워졌을 때 한꺼번에 몰아서 움직이지 않도록.
+            self.pending_dt = 0.0
+            self.pending_steps = 0
+            return None
+        if self.tier == MID and not dead and self.pending_steps < self.mid_interval:
+            return None
+
+        dt = self.pending_dt
+        self.pending_dt = 0.0
+        self.pending_steps = 0
+        return dt
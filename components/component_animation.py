@@ -1,4 +1,3 @@
-import game_framework
 from components.component_base import Component
 from components.component_sprite import SpriteComponent
 
@@ -9,7 +8,7 @@ class AnimationComponent(Component):
         self.fps = fps
 
     def update(self):
-        dt = game_framework.frame_time
+        dt = self.owner.world.dt
         sprite = self.owner.get(SpriteComponent)
         if not sprite:
             return
@@ -1,6 +1,3 @@
-import game_framework
-import game_world
-
 from components.component_base import Component
 from components.component_combat import CombatComponent
 from components.component_transform import TransformComponent
@@ -53,7 +50,7 @@ class AttackComponent(Component):
         if not self.is_attacking():
             return
 
-        self.attack_timer -= game_framework.frame_time
+        self.attack_timer -= self.owner.world.dt
 
         if 0.1 < self.attack_timer < 0.2:
             self.check_attack_collision()
@@ -109,10 +106,11 @@ class AttackComponent(Component):
             attack_box_y + half_h,
         )
 
-        for target in game_world.all_objects():
+        # 피해를 받을 수 있는 대상(CombatComponent 보유)만 검사한다.
+        for target in self.owner.world.query(TransformComponent, CombatComponent):
             if target == self.owner:
                 continue
-            if hasattr(target, 'get_bb') and target not in self.hit_monsters:
+            if target not in self.hit_monsters:
                 target_bb = target.get_bb()
                 if (
                     attack_bb[0] < target_bb[2]
@@ -120,10 +118,5 @@ class AttackComponent(Component):
                     and attack_bb[1] < target_bb[3]
                     and attack_bb[3] > target_bb[1]
                 ):
-                    combat = target.get(CombatComponent) if hasattr(target, 'get') else None
-                    if combat:
-                        combat.take_damage(self.damage)
-                    elif hasattr(target, 'take_damage'):
-                        target.take_damage(self.damage)
-
+                    target.get(CombatComponent).take_damage(self.damage)
                     self.hit_monsters.append(target)
@@ -2,25 +2,82 @@ from components.component_base import Component
 from components.component_transform import TransformComponent
 
 
+def _shape_property(name):
+    # 박스 모양 값. 바뀌면 등록된 CollisionManager 가 모아 둔 모양 배열을 다시 만들게 알린다.
+    attr = "_" + name
+
+    def getter(self):
+        return getattr(self, attr)
+
+    def setter(self, value):
+        setattr(self, attr, value)
+        if self._manager is not None:
+            self._manager.reshape(self)
+
+    return property(getter, setter)
+
+
 class CollisionComponent(Component):
-    def __init__(self, group, mask, offset_x=0, offset_y=0, width=None, height=None):
+    offset_x = _shape_property("offset_x")
+    offset_y = _shape_property("offset_y")
+    override_width = _shape_property("override_width")
+    override_height = _shape_property("override_height")
+
+    def __init__(self, group, mask, offset_x=0, offset_y=0, width=None, height=None, continuous=False):
         super().__init__()
+        self._manager = None  # 등록된 CollisionManager (mask 가 바뀌면 버킷을 옮겨 달라고 알린다)
         self.group = group
         self.mask = mask
         self.offset_x = offset_x
         self.offset_y = offset_y
         self.override_width = width
         self.override_height = height
+        # True 면 빠른 투사체처럼 한 스텝에 크게 움직이는 객체: 직전 위치 -> 현재 위치 경로 전체로 충돌을 검사한다.
+        self.continuous = continuous
+
+    @property
+    def mask(self):
+        return self._mask
+
+    @mask.setter
+    def mask(self, value):
+        old = getattr(self, "_mask", None)
+        self._mask = value
+        if self._manager is not None and old != value:
+            self._manager.rebucket(self, old)
 
     def get_bb(self):
         tr = self.owner.get(TransformComponent)
         if not tr:
             return 0, 0, 0, 0
+        return self._bb_at(tr, tr.x, tr.y)
+
+    def get_prev_bb(self):
+        # 스텝 시작 시점(store_previous 때)의 충돌 박스
+        tr = self.owner.get(TransformComponent)
+        if not tr:
+            return 0, 0, 0, 0
+        return self._bb_at(tr, tr.prev_x, tr.prev_y)
+
+    def get_displacement(self):
+        tr = self.owner.get(TransformComponent)
+        if not tr:
+            return 0.0, 0.0
+        return tr.x - tr.prev_x, tr.y - tr.prev_y
+
+    def get_broadphase_bb(self):
+        # continuous 면 이번 스텝에 지나간 영역 전체를 덮는 박스
+        if not self.continuous:
+            return self.get_bb()
+        left, bottom, right, top = self.get_bb()
+        prev_left, prev_bottom, prev_right, prev_top = self.get_prev_bb()
+        return min(left, prev_left), min(bottom, prev_bottom), max(right, prev_right), max(top, prev_top)
 
-        half_w = (self.override_width or tr.w) * 0.5
-        half_h = (self.override_height or tr.h) * 0.5
+    def _bb_at(self, tr, x, y):
+        half_w = (self._override_width or tr.w) * 0.5
+        half_h = (self._override_height or tr.h) * 0.5
 
-        cx = tr.x + self.offset_x
-        cy = tr.y + self.offset_y
+        cx = x + self._offset_x
+        cy = y + self._offset_y
 
         return cx - half_w, cy - half_h, cx + half_w, cy + half_h
@@ -1,6 +1,7 @@
+from collision_manager import CollisionGroup
 from components.component_base import Component
 from components.component_state_machine import StateMachineComponent
-import game_framework
+from event_bus import DAMAGE_DEALT, PLAYER_DIED
 
 class CombatComponent(Component):
     def __init__(self, max_hp, invincible_duration=0.0, enable_invincibility=False):
@@ -15,7 +16,13 @@ class CombatComponent(Component):
         if self.enable_invincibility and self.invincible_timer > 0:
             return
 
+        was_alive = self.hp > 0
         self.hp -= dmg
+        events = self._events()
+        if events is not None:
+            events.emit(DAMAGE_DEALT, target=self.owner, amount=dmg)
+            if was_alive and self.hp <= 0 and getattr(self.owner, "collision_group", None) == CollisionGroup.PLAYER:
+                events.emit(PLAYER_DIED, player=self.owner)
         if self.hp <= 0:
             sm = self.owner.get(StateMachineComponent)
             if sm:
@@ -24,10 +31,14 @@ class CombatComponent(Component):
             # 피격 후 무적 시간
             self.invincible_timer = self.invincible_duration
 
+    def _events(self):
+        world = getattr(self.owner, "world", None)
+        return getattr(world, "events", None)
+
     def update(self):
         if not self.enable_invincibility:
             return
 
-        dt = game_framework.frame_time
+        dt = self.owner.world.dt
         if self.invincible_timer > 0:
             self.invincible_timer -= dt
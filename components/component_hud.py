@@ -1,12 +1,16 @@
 import os
-from pico2d import load_image
 
 from common import resource_path
+import asset_loader
 from components.component_base import Component
 from components.component_transform import TransformComponent
 
+HP_BAR_PATH = resource_path("resource/Image/GUI/hp_bar.png")
+BAR_BASE_PATH = resource_path("resource/Image/GUI/bar_base.png")
+
 
 class HUDComponent(Component):
+    ASSETS = [HP_BAR_PATH, BAR_BASE_PATH]
     _hp_bar_image = None
     _bar_base_image = None
 
@@ -18,11 +22,18 @@ class HUDComponent(Component):
         self.mp_height = mp_height
         self.hp_offset = hp_offset
         self.mp_offset = mp_offset
+        HUDComponent._load_images()
+
+    def __setstate__(self, state):
+        # 스냅샷에서 복원할 때는 __init__ 을 거치지 않으므로 공유 이미지를 여기서 준비한다.
+        self.__dict__.update(state)
+        HUDComponent._load_images()
 
+    @staticmethod
+    def _load_images():
         if HUDComponent._hp_bar_image is None or HUDComponent._bar_base_image is None:
-            gui_dir = "resource/Image/GUI"
-            HUDComponent._hp_bar_image = load_image(resource_path(f"{gui_dir}/hp_bar.png"))
-            HUDComponent._bar_base_image = load_image(resource_path(f"{gui_dir}/bar_base.png"))
+            HUDComponent._hp_bar_image = asset_loader.load_image(HP_BAR_PATH)
+            HUDComponent._bar_base_image = asset_loader.load_image(BAR_BASE_PATH)
 
     def draw(self):
         owner = self.owner
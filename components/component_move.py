@@ -1,6 +1,5 @@
 from enum import Enum
-from pico2d import clamp, get_canvas_width, get_canvas_height
-import game_framework
+from pico2d import clamp
 
 from components.component_base import Component
 from components.component_sprite import SpriteComponent
@@ -20,6 +19,7 @@ class MovementComponent(Component):
         self.ydir = 0
         self.speed = speed
         self.face_dir = 1  # 1 = right, -1 = left
+        self.clamp_to_bounds = True
 
         self.type = MovementType.DIRECTIONAL
         self._path_timer = 0.0
@@ -78,13 +78,15 @@ class MovementComponent(Component):
             if state_machine and state_machine.is_attacking():
                 return
 
-            dt = game_framework.frame_time
+            dt = self.owner.world.dt
 
             tr.x += self.xdir * self.speed * dt
             tr.y += self.ydir * self.speed * dt
-            # 화면 밖으로 나가지 않도록 클램핑
-            tr.x = clamp(200, tr.x, get_canvas_width()-200)
-            tr.y = clamp(100, tr.y, get_canvas_height()*2-100)
+            if self.clamp_to_bounds:
+                # 월드 밖으로 나가지 않도록 클램핑
+                play = self.owner.world.bounds.play
+                tr.x = clamp(play.left, tr.x, play.right)
+                tr.y = clamp(play.bottom, tr.y, play.top)
         elif self.type == MovementType.LINEAR:
             self.update_linear(tr)
         elif self.type == MovementType.PARABOLIC:
@@ -99,7 +101,7 @@ class MovementComponent(Component):
         self._reset_path()
 
     def update_linear(self, tr):
-        dt = game_framework.frame_time
+        dt = self.owner.world.dt
         self._path_timer += dt
         t = min(self._path_timer / self._path_duration, 1.0)
         tr.x = (1 - t) * self._path_start[0] + t * self._path_end[0]
@@ -109,7 +111,7 @@ class MovementComponent(Component):
             self._complete_path()
 
     def update_parabolic(self, tr):
-        dt = game_framework.frame_time
+        dt = self.owner.world.dt
         self._path_timer += dt
         t = min(self._path_timer / self._path_duration, 1.0)
         tr.x = (1 - t) * self._path_start[0] + t * self._path_end[0]
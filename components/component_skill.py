@@ -1,6 +1,5 @@
 import math
 
-import game_world
 
 from components.component_base import Component
 from components.component_move import MovementComponent
@@ -38,5 +37,5 @@ class SkillComponent(Component):
             dir_x /= norm
             dir_y /= norm
 
-        fireball = FireBall(transform.x, transform.y, (dir_x, dir_y))
-        game_world.add_object(fireball, 1)
+        fireball = owner.world.pools.acquire(FireBall, transform.x, transform.y, (dir_x, dir_y))
+        owner.world.add_object(fireball, 1)
@@ -5,3 +5,14 @@ class TransformComponent(Component):
         super().__init__()
         self.x, self.y = x, y
         self.w, self.h = w, h
+        # 직전 고정 스텝의 위치 (렌더 보간용)
+        self.prev_x, self.prev_y = x, y
+
+    def store_previous(self):
+        self.prev_x, self.prev_y = self.x, self.y
+
+    def interpolated(self, alpha):
+        return (
+            self.prev_x + (self.x - self.prev_x) * alpha,
+            self.prev_y + (self.y - self.prev_y) * alpha,
+        )
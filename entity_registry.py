@@ -0,0 +1,96 @@
+# 엔티티 등록부
+# 엔티티 ID 는 (세대 << INDEX_BITS) | 슬롯 번호 인 정수다.
+# 슬롯은 재사용되지만 제거할 때마다 세대가 올라가므로, 이미 제거된 엔티티의 오래된 ID 로는 새 객체를 찾을 수 없다.
+INDEX_BITS = 20
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+
+class EntityRegistry:
+    def __init__(self):
+        self._objects = []
+        self._generations = []
+        self._free = []
+        self.count = 0
+
+    def create(self, obj):
+        if self._free:
+            index = self._free.pop()
+            self._objects[index] = obj
+        else:
+            index = len(self._objects)
+            self._objects.append(obj)
+            self._generations.append(0)
+        self.count += 1
+        return (self._generations[index] << INDEX_BITS) | index
+
+    def destroy(self, entity_id):
+        obj = self.get(entity_id)
+        if obj is None:
+            return None
+        index = entity_id & INDEX_MASK
+        self._objects[index] = None
+        self._generations[index] += 1
+        self._free.append(index)
+        self.count -= 1
+        return obj
+
+    def get(self, entity_id):
+        index = entity_id & INDEX_MASK
+        if index >= len(self._objects) or self._generations[index] != entity_id >> INDEX_BITS:
+            return None
+        return self._objects[index]
+
+    def is_alive(self, entity_id):
+        return self.get(entity_id) is not None
+
+    def clear(self):
+        # 살아 있던 ID 들이 모두 무효가 되도록 세대를 올린 뒤 슬롯을 비운다.
+        for index, obj in enumerate(self._objects):
+            if obj is not None:
+                self._objects[index] = None
+                self._generations[index] += 1
+                self._free.append(index)
+        self.count = 0
+
+
+class PackedList:
+    # 원소 -> 위치 인덱스 맵을 함께 가진 리스트. 삭제는 마지막 원소를 빈자리로 옮기는 swap-and-pop 이라 O(1) 이다.
+    # 대신 삭제 후 원소 순서는 유지되지 않는다.
+    def __init__(self):
+        self.items = []
+        self._index = {}
+
+    def append(self, item):
+        if item in self._index:
+            return
+        self._index[item] = len(self.items)
+        self.items.append(item)
+
+    def remove(self, item):
+        index = self._index.pop(item, None)
+        if index is None:
+            return False
+        last = self.items.pop()
+        if last is not item:
+            self.items[index] = last
+            self._index[last] = index
+        return True
+
+    def clear(self):
+        self.items.clear()
+        self._index.clear()
+
+    def index(self, item):
+        return self._index[item]
+
+    def __contains__(self, item):
+        return item in self._index
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
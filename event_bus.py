@@ -0,0 +1,59 @@
+# 월드 이벤트 버스
+# emit() 은 구독자를 등록 순서대로 바로(동기적으로) 호출한다. 큐나 스레드는 없다.
+# 승리/패배 판정, 처치 보상, 통계는 매 프레임 상태를 검사하는 대신 여기에 구독한다.
+from collections import Counter
+
+ENTITY_SPAWNED = "entity_spawned"  # (entity, group) 월드에 추가됨
+ENTITY_DIED = "entity_died"        # (entity, group) remove_object 로 월드에서 빠짐 (몬스터 사망, 투사체 소멸 등)
+PLAYER_DIED = "player_died"        # (player) 플레이어 HP 가 0 이하가 됨
+DAMAGE_DEALT = "damage_dealt"      # (target, amount) CombatComponent 가 피해를 받음
+
+
+class EventBus:
+    def __init__(self):
+        self._handlers = {}       # 이벤트 이름 -> [handler, ...]
+        self.emitted = Counter()  # 이벤트 이름 -> 발생 횟수
+
+    def subscribe(self, event, handler):
+        self._handlers.setdefault(event, []).append(handler)
+
+    def unsubscribe(self, event, handler):
+        handlers = self._handlers.get(event)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+
+    def emit(self, event, **payload):
+        self.emitted[event] += 1
+        for handler in self._handlers.get(event, ()):
+            handler(**payload)
+
+    def clear(self):
+        self._handlers.clear()
+        self.emitted.clear()
+
+
+class LiveCounts:
+    # 월드에 살아 있는 엔티티 수 (충돌 그룹별, 클래스 이름별). 스폰/사망 이벤트로만 갱신한다.
+    def __init__(self, bus):
+        self.by_group = Counter()
+        self.by_type = Counter()
+        bus.subscribe(ENTITY_SPAWNED, self._on_spawned)
+        bus.subscribe(ENTITY_DIED, self._on_died)
+
+    def group(self, group):
+        return self.by_group[group]
+
+    def type(self, type_name):
+        return self.by_type[type_name]
+
+    def _on_spawned(self, entity, group):
+        self.by_group[group] += 1
+        self.by_type[type(entity).__name__] += 1
+
+    def _on_died(self, entity, group):
+        self.by_group[group] -= 1
+        self.by_type[type(entity).__name__] -= 1
+
+    def clear(self):
+        self.by_group.clear()
+        self.by_type.clear()
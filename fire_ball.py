@@ -1,22 +1,29 @@
-from pico2d import load_image
-
 from common import resource_path
+import asset_loader
 from projectile import Projectile
 
 image_path = resource_path('resource/Image/Character/Fire/Fire01_1.png')
 
+FIREBALL_DAMAGE = 5
+FIREBALL_SPEED = 1000
+HITBOX_W, HITBOX_H = 48, 48
+
 
 class FireBall(Projectile):
+    ASSETS = [image_path]
     image = None
+    # 1000 px/s: 프레임이 밀리면 한 스텝에 작은 몬스터를 통과할 수 있다.
+    continuous_collision = True
 
-    def __init__(self, x, y, direction):
+    @staticmethod
+    def _load_image():
         if FireBall.image is None:
-            FireBall.image = load_image(image_path)
+            FireBall.image = asset_loader.load_image(image_path)
+        return FireBall.image
 
-        damage = 5
-        speed = 1000
-
-        hitbox_w = 48
-        hitbox_h = 48
+    def __init__(self, x, y, direction):
+        super().__init__(x, y, direction, FIREBALL_SPEED, FIREBALL_DAMAGE, HITBOX_W, HITBOX_H, FireBall._load_image())
 
-        super().__init__(x, y, direction, speed, damage, hitbox_w, hitbox_h, FireBall.image)
+    def reset(self, x, y, direction):
+        # 풀에 있던 객체가 스냅샷에서 복원된 경우 클래스 이미지가 아직 없을 수 있다.
+        self.launch(x, y, direction, FIREBALL_SPEED, FIREBALL_DAMAGE, HITBOX_W, HITBOX_H, FireBall._load_image())
@@ -0,0 +1,160 @@
+# 프레임 단계별 시간 측정기
+# 최근 history 프레임의 단계별 소요 시간을 고정 크기 링 버퍼에 보관하고 min/avg/p95/p99 를 계산한다.
+import csv
+import time
+
+PHASES = ("handle_events", "update", "collisions", "draw", "render", "frame")
+# 프레임마다 기록하는 개수 값 (시간이 아님)
+COUNTERS = ("drawn", "culled", "ai_ticked", "ai_skipped")
+
+enabled = False
+csv_path = None
+history = 600
+
+_buffers = {}        # phase -> [ms, ...] (길이 history 인 링 버퍼)
+_current = {}        # 진행 중인 프레임의 단계별 누적 시간(초)
+_counts = {}         # 진행 중인 프레임의 개수 값
+_write_index = 0
+_frame_count = 0
+_frame_start = 0.0
+
+
+class _Section:
+    __slots__ = ("phase", "start")
+
+    def __init__(self, phase):
+        self.phase = phase
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current[self.phase] += time.perf_counter() - self.start
+        return False
+
+
+class _NullSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_null_section = _NullSection()
+_sections = {}
+
+
+def enable(history_size=600, dump_path=None):
+    global enabled, history, csv_path
+    enabled = True
+    history = max(1, history_size)
+    csv_path = dump_path
+    reset()
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def reset():
+    global _write_index, _frame_count, _frame_start
+    _buffers.clear()
+    _current.clear()
+    _counts.clear()
+    _sections.clear()
+    for phase in PHASES:
+        _buffers[phase] = [0.0] * history
+        _current[phase] = 0.0
+        _sections[phase] = _Section(phase)
+    for counter in COUNTERS:
+        _buffers[counter] = [0] * history
+        _counts[counter] = 0
+    _write_index = 0
+    _frame_count = 0
+    _frame_start = time.perf_counter()
+
+
+def measure(phase):
+    # with frame_profiler.measure('update'): ...
+    if not enabled:
+        return _null_section
+    return _sections[phase]
+
+
+def count(counter, value):
+    # 이번 프레임의 개수 값을 기록한다 (같은 프레임에 여러 번 호출하면 더해진다).
+    if enabled:
+        _counts[counter] += value
+
+
+def begin_frame():
+    global _frame_start
+    if enabled:
+        _frame_start = time.perf_counter()
+
+
+def end_frame():
+    # 한 프레임의 측정값을 링 버퍼에 기록한다.
+    global _write_index, _frame_count
+    if not enabled:
+        return
+    _current["frame"] = time.perf_counter() - _frame_start
+
+    for phase in PHASES:
+        _buffers[phase][_write_index] = _current[phase] * 1000.0
+        _current[phase] = 0.0
+    for counter in COUNTERS:
+        _buffers[counter][_write_index] = _counts[counter]
+        _counts[counter] = 0
+    _write_index = (_write_index + 1) % history
+    _frame_count += 1
+
+
+def _recent(phase):
+    # 오래된 프레임부터 순서대로 반환
+    count = min(_frame_count, history)
+    buffer = _buffers[phase]
+    if _frame_count < history:
+        return buffer[:count]
+    return buffer[_write_index:] + buffer[:_write_index]
+
+
+def _percentile(sorted_values, ratio):
+    index = min(len(sorted_values) - 1, int(round(ratio * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def stats():
+    # {phase: {"min", "avg", "p95", "p99"}} (단계는 ms, 개수 값은 개)
+    result = {}
+    if not _buffers:
+        return result
+    for phase in PHASES + COUNTERS:
+        values = sorted(_recent(phase))
+        if not values:
+            continue
+        result[phase] = {
+            "min": values[0],
+            "avg": sum(values) / len(values),
+            "p95": _percentile(values, 0.95),
+            "p99": _percentile(values, 0.99),
+        }
+    return result
+
+
+def dump_csv(path=None):
+    path = path or csv_path
+    if not path or not _buffers:
+        return
+    columns = [_recent(phase) for phase in PHASES]
+    counts = [_recent(counter) for counter in COUNTERS]
+    first_frame = _frame_count - len(columns[0])
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["frame", *[f"{phase}_ms" for phase in PHASES], *COUNTERS])
+        for i, (row, count_row) in enumerate(zip(zip(*columns), zip(*counts))):
+            writer.writerow([first_frame + i, *[f"{value:.3f}" for value in row], *count_row])
@@ -1,11 +1,110 @@
 import time
+
+import asset_loader
+import frame_profiler
+
 frame_time = 0.0
+frame_rate = 0.0
 running = None
 stack = None
 
+# 고정 시간 간격(fixed-step) 시뮬레이션 설정
+# fixed_time_step 이 None 이면 기존처럼 실제 경과 시간을 frame_time 으로 사용한다.
+fixed_time_step = None
+max_catch_up_steps = 5
+# draw() 에서 사용할 보간 계수 (직전 update 와 다음 update 사이의 위치, 0.0 ~ 1.0)
+alpha = 1.0
+# 헤드리스 시뮬레이션용 가상 프레임 시간. 설정하면 실제 시계 대신 매 프레임 이 값만큼 시간이 흐른다.
+synthetic_frame_time = None
+
+# 프레임 페이싱 설정
+# target_fps 가 있으면 남은 시간 동안 sleep 한 뒤 마감 직전 짧게 spin 해서 프레임 간격을 맞춘다.
+# use_vsync 가 True 이면 update_canvas() 의 vsync 대기가 속도를 정하므로 직접 기다리지 않는다.
+target_fps = None
+use_vsync = False
+SPIN_THRESHOLD = 0.002  # 마감 2ms 전부터는 sleep 대신 spin (sleep 오차 보정)
+
+# 적응형 프레임 스킵
+# 직전 프레임의 작업 시간(sleep 제외)이 예산을 넘으면 draw() 를 최대 max_frame_skip 프레임 연속으로 건너뛰고
+# 그 시간을 update 에 쓴다. 0 이면 사용하지 않는다.
+max_frame_skip = 0
+frames_drawn = 0
+frames_skipped = 0
+
+
+def set_fixed_step(rate, max_steps=5):
+    # rate: 초당 update 횟수 (예: 120). None/0 이면 가변 시간 간격으로 되돌린다.
+    global fixed_time_step, max_catch_up_steps
+    fixed_time_step = 1.0 / rate if rate else None
+    max_catch_up_steps = max(1, max_steps)
+
+
+def set_synthetic_frame_time(dt):
+    # dt 를 설정하면 실제 시간과 관계없이 최대 속도로 시뮬레이션한다. None 이면 실제 시계 사용.
+    global synthetic_frame_time
+    synthetic_frame_time = dt
+
+
+def set_frame_pacing(fps=60, vsync=False):
+    # fps: 목표 프레임 수 (None 이면 제한 없음), vsync: open_canvas(sync=True) 와 함께 사용
+    global target_fps, use_vsync
+    target_fps = fps
+    use_vsync = vsync
+
+
+def set_frame_skip(max_skip=2):
+    global max_frame_skip
+    max_frame_skip = max(0, max_skip)
+
+
+def reset_frame_counters():
+    global frames_drawn, frames_skipped
+    frames_drawn = 0
+    frames_skipped = 0
+
+
+def _frame_budget():
+    if target_fps:
+        return 1.0 / target_fps
+    return fixed_time_step
+
+
+def _should_skip_draw(work_time, consecutive_skips):
+    # vsync 대기는 update_canvas() 안에서 일어나 작업 시간에 섞이므로 vsync 사용 시에는 끈다.
+    if max_frame_skip <= 0 or synthetic_frame_time is not None or use_vsync:
+        return False
+    if consecutive_skips >= max_frame_skip:
+        return False
+    budget = _frame_budget()
+    return budget is not None and work_time > budget
+
+
+def _wait_until(deadline):
+    remaining = deadline - time.perf_counter()
+    if remaining > SPIN_THRESHOLD:
+        time.sleep(remaining - SPIN_THRESHOLD)
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _through_loading(mode):
+    # 모드가 필요로 하는 리소스가 아직 준비되지 않았으면 로딩 화면을 거쳐서 진입한다.
+    required = getattr(mode, "required_assets", None)
+    if required is None:
+        return mode
+    assets = required()
+    if asset_loader.is_ready(assets):
+        return mode
+
+    from modes import loading_mode
+    loading_mode.prepare(mode, assets)
+    return loading_mode
+
+
 #현재모드 제거 후 새 모드 추가
 def change_mode(mode):
     global stack
+    mode = _through_loading(mode)
     if (len(stack)>0):
         stack[-1].finish()
         stack.pop()
@@ -15,6 +114,7 @@ def change_mode(mode):
 # 현재모드 일시정지 후 새 모드 추가
 def push_mode(mode):
     global stack
+    mode = _through_loading(mode)
     if (len(stack)>0):
         stack[-1].pause()
     stack.append(mode)
@@ -34,24 +134,97 @@ def quit():
     global running
     running = False
 
-def run(start_mode):
-    global running, stack
+
+def _run_fixed_steps(accumulator):
+    # 누적된 시간을 고정 간격으로 소비한다. 한 프레임에서 따라잡는 횟수는 max_catch_up_steps 로 제한.
+    global frame_time
+    mode = stack[-1]
+    steps = 0
+    while running and accumulator >= fixed_time_step and steps < max_catch_up_steps:
+        frame_time = fixed_time_step
+        with frame_profiler.measure("update"):
+            mode.update()
+        accumulator -= fixed_time_step
+        steps += 1
+        if stack[-1] is not mode:
+            # 모드가 바뀌면 이전 모드의 밀린 시간은 버린다.
+            return 0.0
+
+    if accumulator >= fixed_time_step:
+        # 따라잡기 한도를 넘긴 시간은 버려서 긴 프레임 이후 시뮬레이션이 폭주하지 않게 한다.
+        accumulator %= fixed_time_step
+    return accumulator
+
+
+def run(start_mode, until=None):
+    # until: 매 프레임 끝에 호출되는 종료 조건 (True 를 반환하면 루프 종료)
+    global running, stack, alpha, frame_rate, frames_drawn, frames_skipped
     running = True
     stack = [start_mode]
     start_mode.init()
 
     global frame_time
     frame_time = 0.0
-    current_time = time.time()
+    accumulator = 0.0
+    current_time = time.perf_counter()
+    next_frame_deadline = current_time
+    work_time = 0.0
+    consecutive_skips = 0
     while running:
-        stack[-1].handle_events()
-        stack[-1].update()
-        stack[-1].draw()
+        work_start = time.perf_counter()
+        frame_profiler.begin_frame()
+        mode = stack[-1]
+        with frame_profiler.measure("handle_events"):
+            stack[-1].handle_events()
+        if fixed_time_step is None:
+            with frame_profiler.measure("update"):
+                stack[-1].update()
+            alpha = 1.0
+        else:
+            accumulator = _run_fixed_steps(accumulator)
+            alpha = accumulator / fixed_time_step
+        if stack[-1] is mode and _should_skip_draw(work_time, consecutive_skips):
+            # 시뮬레이션이 밀리고 있으므로 이번 프레임은 그리지 않는다 (update_canvas 포함).
+            consecutive_skips += 1
+            frames_skipped += 1
+        else:
+            with frame_profiler.measure("draw"):
+                stack[-1].draw()
+            consecutive_skips = 0
+            frames_drawn += 1
+        # 프리페치된 리소스를 프레임마다 조금씩 텍스처로 만든다.
+        asset_loader.pump()
+        frame_profiler.end_frame()
+        work_time = time.perf_counter() - work_start
+
+        if synthetic_frame_time is None and target_fps and not use_vsync:
+            frame_period = 1.0 / target_fps
+            next_frame_deadline += frame_period
+            if next_frame_deadline < time.perf_counter() - frame_period:
+                # 한 프레임 이상 밀렸으면 마감 시각을 다시 잡아 몰아서 달리지 않게 한다.
+                next_frame_deadline = time.perf_counter()
+            _wait_until(next_frame_deadline)
 
-        frame_time = time.time() - current_time
-        current_time += frame_time
-        frame_rate = 1.0 / frame_time
+        if synthetic_frame_time is not None:
+            elapsed = synthetic_frame_time
+        else:
+            elapsed = time.perf_counter() - current_time
+            current_time += elapsed
+        if stack and stack[-1] is not mode:
+            # init() 에서의 리소스 로딩 시간이 다음 update 로 넘어가지 않도록 한다.
+            elapsed = 0.0
+            accumulator = 0.0
+        if fixed_time_step is None:
+            frame_time = elapsed
+        else:
+            accumulator += elapsed
+        frame_rate = 1.0 / elapsed if elapsed > 0 else 0.0
+
+        if until is not None and until():
+            running = False
 
     while (len(stack)>0):
         stack[-1].finish()
         stack.pop()
+
+    frame_profiler.dump_csv()
@@ -1,3 +1,5 @@
+import game_framework
+import game_world
 from components.component_transform import TransformComponent
 
 
@@ -5,12 +7,25 @@ class GameObject:
     def __init__(self):
         self.components = []
         self.active = True
+        # 생성 시점의 활성 월드. add_object() 로 다른 월드에 추가되면 그 월드로 바뀐다.
+        self.world = game_world.current
+        self.entity_id = None  # 월드에 추가될 때 World.entities 가 발급한다
+        self.pool = None  # object_pool 에서 만들어졌으면 돌아갈 풀
 
     def add_component(self, comp):
         comp.owner = self
         self.components.append(comp)
+        if self.entity_id is not None:
+            self.world.component_set_changed(self)
         return comp
 
+    def remove_component(self, comp):
+        if comp in self.components:
+            self.components.remove(comp)
+            comp.owner = None
+            if self.entity_id is not None:
+                self.world.component_set_changed(self)
+
     def get(self, comp_type):
         # 원하는 컴포넌트 타입을 가져오기
         for c in self.components:
@@ -32,6 +47,9 @@ class GameObject:
 
         if tr and camera:
             original_pos = (tr.x, tr.y)
+            if game_framework.alpha < 1.0:
+                # 고정 스텝 사이의 위치를 보간해서 그린다.
+                tr.x, tr.y = tr.interpolated(game_framework.alpha)
             tr.x -= camera.x
             tr.y -= camera.y
 
@@ -1,81 +1,429 @@
 # game_world.py
+# 월드 상태(레이어, 충돌 그룹, 충돌 관리자, 카메라)는 World 객체가 가진다.
+# 모듈 함수들은 현재 활성화된 월드(current)에 위임하므로 기존 호출부는 그대로 동작하고,
+# 한 프로세스에서 여러 World 를 만들어 번갈아 쓸 수도 있다.
+# update/충돌 처리 도중의 add_object/remove_object 는 바로 적용하지 않고 명령 버퍼에 쌓았다가
+# 스텝이 끝날 때 한 번에 적용한다. 그래서 순회 중인 레이어가 바뀌지 않아 복사본을 만들 필요가 없다.
 
-from collision_manager import CollisionGroup, collision_manager
+from contextlib import contextmanager
 
-camera = None
+import frame_profiler
+import game_framework
+import transform_store
+from entity_registry import EntityRegistry, PackedList
+from event_bus import ENTITY_DIED, ENTITY_SPAWNED, EventBus, LiveCounts
+from object_pool import PoolRegistry
+from rng import RandomStreams
+from world_bounds import WorldBounds
+from collision_manager import CollisionGroup, CollisionManager
+from components.component_ai_lod import AILodComponent
+from components.component_transform import TransformComponent
 
-world = [[] for _ in range(4)]
-group_objects = {group: [] for group in CollisionGroup}
+LAYER_COUNT = 4
+CULL_MARGIN = 100  # 카메라 밖이라도 이 거리(px) 안이면 그린다 (HP 바, 스프라이트 여백 등)
 
-player = group_objects[CollisionGroup.PLAYER]
-monsters = group_objects[CollisionGroup.MONSTER]
-projectiles = group_objects[CollisionGroup.PROJECTILE]
+ADD = 0
+REMOVE = 1
 
 
-def add_object(o, depth=0):
-    world[depth].append(o)
-    collision_manager.register(o)
+class World:
+    def __init__(self, seed=None, use_soa=False, size=None):
+        # 레이어/그룹은 PackedList 라 삭제가 O(1) 이고, 각 엔티티가 어느 레이어/그룹에 있는지는 _placement 에 둔다.
+        self.entities = EntityRegistry()
+        self.layers = [PackedList() for _ in range(LAYER_COUNT)]
+        self.group_objects = {group: PackedList() for group in CollisionGroup}
+        self._placement = {}  # entity_id -> (depth, group)
+        self._commands = []   # 지연된 (ADD, o, depth) / (REMOVE, o, None)
+        self._removing = set()
+        self._deferring = False
+        # 컴포넌트 조합 -> 그 컴포넌트를 모두 가진 엔티티 목록. 추가/삭제/컴포넌트 변경 때만 갱신된다.
+        self._queries = {}
+        self.pools = PoolRegistry()
+        # 엔티티 스폰/사망 등은 이벤트로 알리고, 살아 있는 수는 live 가 그룹/타입별로 센다.
+        self.events = EventBus()
+        self.live = LiveCounts(self.events)
+        # 직전 render() 에서 그린/건너뛴 객체 수
+        self.drawn_count = 0
+        self.culled_count = 0
+        # use_soa 이고 NumPy 가 있으면 위치/이동 값을 SoA 배열에 두고 방향 이동을 벡터 연산으로 처리한다.
+        self.transforms = transform_store.TransformStore() if use_soa and transform_store.AVAILABLE else None
+        self.collision_manager = CollisionManager(transforms=self.transforms)
+        self.camera = None
+        # 월드 크기와 이동/스폰/제거 영역. size 가 None 이면 화면 너비 x 화면 높이 2배
+        self.bounds = WorldBounds(size)
+        # 청크 스트리밍 (chunk_streamer.ChunkStreamer). None 이면 모든 엔티티가 항상 로드되어 있다.
+        self.streamer = None
+        self.rng = RandomStreams(seed)
+        self.dt = 0.0  # 이번 스텝의 시간 간격. 컴포넌트와 몬스터는 전역 시계 대신 owner.world.dt 를 읽는다.
+        self.tick = 0  # 지금까지 진행한 step() 횟수 (리플레이의 시간 기준)
+
+    @property
+    def player(self):
+        return self.group_objects[CollisionGroup.PLAYER]
+
+    @property
+    def monsters(self):
+        return self.group_objects[CollisionGroup.MONSTER]
+
+    @property
+    def projectiles(self):
+        return self.group_objects[CollisionGroup.PROJECTILE]
+
+    def add_object(self, o, depth=0):
+        if self._deferring:
+            o.world = self
+            self._commands.append((ADD, o, depth))
+            return
+        self._add_now(o, depth)
+
+    def _add_now(self, o, depth, notify=True):
+        # notify 가 False 면 스폰 이벤트를 보내지 않는다 (청크에서 다시 불러온 엔티티)
+        if self.contains(o):
+            return
+        entity_id = self.entities.create(o)
+        o.entity_id = entity_id
+        o.world = self
+        if self.transforms is not None:
+            self.transforms.attach(o, entity_id)
+        self.layers[depth].append(o)
+        self.collision_manager.register(o)
+
+        group = getattr(o, "collision_group", None)
+        if group in self.group_objects:
+            self.group_objects[group].append(o)
+        else:
+            group = None
+        self._placement[entity_id] = (depth, group)
+
+        for component_types, matches in self._queries.items():
+            if _has_components(o, component_types):
+                matches.append(o)
+        if notify:
+            self.events.emit(ENTITY_SPAWNED, entity=o, group=group)
+
+    def query(self, *component_types):
+        # 주어진 컴포넌트를 모두 가진 엔티티 목록 (캐시된 PackedList 이므로 수정하지 말 것)
+        key = frozenset(component_types)
+        matches = self._queries.get(key)
+        if matches is None:
+            matches = PackedList()
+            for layer in self.layers:
+                for o in layer:
+                    if _has_components(o, key):
+                        matches.append(o)
+            self._queries[key] = matches
+        return matches
+
+    def component_set_changed(self, o):
+        # 월드에 있는 엔티티의 컴포넌트가 추가/삭제되면 GameObject 가 호출한다.
+        if not self.contains(o):
+            return
+        for component_types, matches in self._queries.items():
+            if _has_components(o, component_types):
+                matches.append(o)
+            else:
+                matches.remove(o)
+
+    def contains(self, o):
+        entity_id = getattr(o, "entity_id", None)
+        return entity_id is not None and self.entities.get(entity_id) is o
+
+    def get_entity(self, entity_id):
+        # 제거된 엔티티의 ID 면 None
+        return self.entities.get(entity_id)
+
+    def add_objects(self, ol, depth=0):
+        for o in ol:
+            self.add_object(o, depth)
+
+    @contextmanager
+    def deferred(self):
+        # 블록 안에서 요청된 추가/삭제를 모아 두었다가 블록이 끝날 때 한 번에 적용한다.
+        if self._deferring:
+            yield
+            return
+        self._deferring = True
+        try:
+            yield
+        finally:
+            self._deferring = False
+            self.flush()
+
+    def flush(self):
+        commands = self._commands
+        self._commands = []
+        self._removing.clear()
+        for command, o, depth in commands:
+            if command == ADD:
+                self._add_now(o, depth)
+            else:
+                self._remove_now(o)
+
+    def update(self, dt):
+        self.dt = dt
+        with self.deferred():
+            for layer in self.layers:
+                for o in layer:
+                    if getattr(o, "active", True):
+                        o.update()
+            self.integrate_movement()
+
+    def integrate_movement(self):
+        if self.transforms is not None:
+            self.transforms.integrate(self.bounds.play)
+
+    def step(self, dt, player=None):
+        # 한 번의 시뮬레이션 스텝: 모든 객체 update -> 카메라 -> 충돌 처리 -> 지연된 추가/삭제 적용
+        # dt 는 이 월드에만 적용되므로 한 프로세스에서 여러 월드를 각자의 시간 간격으로 진행할 수 있다.
+        self.dt = dt
+        self.store_previous_positions()
+        ai_ticked = ai_skipped = 0
+        with self.deferred():
+            for layer in self.layers:
+                for o in layer:
+                    if not getattr(o, "active", True):
+                        continue
+                    if player is not None and getattr(o, "collision_group", None) == CollisionGroup.MONSTER:
+                        if self._update_monster(o, player):
+                            ai_ticked += 1
+                        else:
+                            ai_skipped += 1
+                    else:
+                        o.update()
+            self.integrate_movement()
+
+            if self.camera and player is not None:
+                self.camera.update(player)
+            self.handle_collisions()
+        self.update_streaming()
+        self.tick += 1
+        frame_profiler.count("ai_ticked", ai_ticked)
+        frame_profiler.count("ai_skipped", ai_skipped)
+
+    def update_streaming(self):
+        # 카메라 주변을 벗어난 청크를 내리고, 다시 가까워진 청크를 불러온다.
+        if self.streamer is not None and self.camera is not None:
+            self.streamer.update(self.camera)
+
+    def _update_monster(self, monster, player):
+        # AI LOD: 먼 몬스터는 건너뛰거나 밀린 시간을 모아 가끔만 update 한다.
+        lod = monster.get(AILodComponent)
+        if lod is None:
+            monster.update(player)
+            return True
+
+        step_dt = self.dt
+        dt = lod.tick(player, step_dt)
+        if dt is None:
+            return False
+        # 밀린 시간을 한 번에 받는 몬스터는 자기 update 동안만 이 월드의 dt 를 그 값으로 본다.
+        self.dt = dt
+        try:
+            monster.update(player)
+        finally:
+            self.dt = step_dt
+        return True
+
+    def store_previous_positions(self):
+        # 고정 스텝 시작 시점의 위치를 저장해 draw() 에서 보간할 수 있게 한다.
+        if self.camera is not None:
+            self.camera.store_previous()
+        if self.transforms is not None:
+            self.transforms.store_previous()
+            return
+        for layer in self.layers:
+            for o in layer:
+                tr = getattr(o, "transform", None)
+                if tr is not None:
+                    tr.store_previous()
+
+    def render(self):
+        cam = self.camera
+        drawn = culled = 0
+        camera_pos = None
+        if cam is not None and game_framework.alpha < 1.0:
+            # 엔티티 위치와 같은 alpha 로 카메라도 보간해야 스크롤할 때 떨리지 않는다 (배경 포함).
+            camera_pos = (cam.x, cam.y)
+            cam.x, cam.y = cam.interpolated(game_framework.alpha)
+        try:
+            with frame_profiler.measure("render"):
+                view = _camera_rect(cam)
+                for layer in self.layers:
+                    for o in layer:
+                        if view is not None and not _is_visible(o, view):
+                            culled += 1
+                            continue
+                        if hasattr(o, "draw_with_camera"):
+                            o.draw_with_camera(cam)
+                        else:
+                            o.draw()
+                        drawn += 1
+        finally:
+            if camera_pos:
+                cam.x, cam.y = camera_pos
+        self.drawn_count = drawn
+        self.culled_count = culled
+        frame_profiler.count("drawn", drawn)
+        frame_profiler.count("culled", culled)
+
+    def clear(self):
+        # 아직 적용되지 않은 추가/삭제 명령도 버린다.
+        self._commands.clear()
+        self._removing.clear()
+        if self.transforms is not None:
+            self.transforms.detach_all()
+        for objs in self.group_objects.values():
+            objs.clear()
+
+        for layer in self.layers:
+            layer.clear()
+
+        self.collision_manager.clear()
+        self.entities.clear()
+        for matches in self._queries.values():
+            matches.clear()
+        self._placement.clear()
+        if self.streamer is not None:
+            self.streamer.clear()
+        # 구독은 유지하고 개수만 초기화한다 (clear 는 사망 이벤트를 보내지 않는다).
+        self.live.clear()
 
-    group = getattr(o, "collision_group", None)
-    if group in group_objects:
-        group_objects[group].append(o)
+    def all_objects(self):
+        result = []
+        for layer in self.layers:
+            result.extend(layer)
+        return result
+
+    def handle_collisions(self):
+        with frame_profiler.measure("collisions"):
+            with self.deferred():
+                self.collision_manager.handle_collisions()
+
+    def remove_object(self, o):
+        if self._deferring:
+            # 같은 스텝에서 두 번 제거 요청이 와도 한 번만 처리한다.
+            if o in self._removing:
+                return
+            self._removing.add(o)
+            o.active = False
+            self._commands.append((REMOVE, o, None))
+            return
+        self._remove_now(o)
+
+    def unload_object(self, o):
+        # 청크 스트리밍용: 사망 이벤트/풀 반환 없이 월드에서 내리고 들어 있던 레이어 번호를 돌려준다.
+        depth, _ = self._placement[o.entity_id]
+        self._remove_now(o, notify=False)
+        return depth
+
+    def reload_object(self, o, depth):
+        self._add_now(o, depth, notify=False)
+
+    def _remove_now(self, o, notify=True):
+        # notify 가 False 면 사망 이벤트를 보내지 않고 풀에도 돌려주지 않는다 (청크 언로드)
+        if not self.contains(o):
+            return
+
+        entity_id = o.entity_id
+        depth, group = self._placement.pop(entity_id)
+        self.layers[depth].remove(o)
+        if group is not None:
+            self.group_objects[group].remove(o)
+        self.collision_manager.unregister(o)
+        if self.transforms is not None:
+            self.transforms.detach(entity_id)
+        self.entities.destroy(entity_id)
+        o.entity_id = None
+        for matches in self._queries.values():
+            matches.remove(o)
+        if not notify:
+            return
+        self.events.emit(ENTITY_DIED, entity=o, group=group)
+
+        # 풀에서 나온 객체는 다음 acquire() 에서 재사용되도록 돌려준다.
+        pool = getattr(o, "pool", None)
+        if pool is not None:
+            pool.release(o)
+
+
+def _camera_rect(cam):
+    # 여백을 포함한 카메라 영역 (left, bottom, right, top). 카메라가 없으면 None (전부 그림)
+    if cam is None:
+        return None
+    return (
+        cam.x - CULL_MARGIN,
+        cam.y - CULL_MARGIN,
+        cam.x + cam.bounds.view_w + CULL_MARGIN,
+        cam.y + cam.bounds.view_h + CULL_MARGIN,
+    )
+
+
+def _is_visible(o, view):
+    # 트랜스폼 박스(없으면 충돌 박스)가 카메라 영역과 겹치는지. 둘 다 없는 객체(배경 등)는 항상 그린다.
+    getter = getattr(o, "get", None)
+    tr = getter(TransformComponent) if callable(getter) else None
+    if tr is not None:
+        half_w, half_h = tr.w * 0.5, tr.h * 0.5
+        left, bottom, right, top = tr.x - half_w, tr.y - half_h, tr.x + half_w, tr.y + half_h
+    elif hasattr(o, "get_bb"):
+        left, bottom, right, top = o.get_bb()
+    else:
+        return True
+    return left <= view[2] and right >= view[0] and bottom <= view[3] and top >= view[1]
+
+
+def _has_components(o, component_types):
+    getter = getattr(o, "get", None)
+    if not callable(getter):
+        return False
+    return all(getter(component_type) is not None for component_type in component_types)
+
+
+current = World()
+
+
+def use(world):
+    # 이후 모듈 함수 호출과 새로 만드는 객체가 사용할 월드를 지정한다.
+    global current
+    current = world
+    return world
+
+
+def add_object(o, depth=0):
+    current.add_object(o, depth)
 
 
 def add_objects(ol, depth=0):
-    for o in ol:
-        add_object(o, depth)
+    current.add_objects(ol, depth)
 
 
 def update():
-    for layer in world:
-        for o in layer:
-            o.update()
+    current.update()
+
+
+def store_previous_positions():
+    current.store_previous_positions()
 
 
 def render():
-    cam = camera
-    for layer in world:
-        for o in layer:
-            if hasattr(o, "draw_with_camera"):
-                o.draw_with_camera(cam)
-            else:
-                o.draw()
+    current.render()
 
 
 def clear():
-    for objs in group_objects.values():
-        objs.clear()
+    current.clear()
 
-    for layer in world:
-        layer.clear()
 
-    collision_manager.clear()
+def all_objects():
+    return current.all_objects()
 
 
-def all_objects():
-    result = []
-    for layer in world:
-        result.extend(layer)
-    return result
+def query(*component_types):
+    return current.query(*component_types)
 
 
 def handle_collisions():
-    collision_manager.handle_collisions()
+    current.handle_collisions()
 
 
 def remove_object(o):
-    if getattr(o, "collision_group", None) == CollisionGroup.MONSTER:
-        for p in player:
-            if hasattr(p, "gold"):
-                p.gold += 30
-
-    for layer in world:
-        if o in layer:
-            layer.remove(o)
-            break
-
-    for objs in group_objects.values():
-        if o in objs:
-            objs.remove(o)
-
-    collision_manager.unregister(o)
\ No newline at end of file
+    current.remove_object(o)
@@ -0,0 +1,101 @@
+# SDL 창 없이 게임 로직만 돌리기 위한 헤드리스 모드
+# 반드시 게임 모듈(모드, 몬스터 등)을 import 하기 전에 install() 을 호출해야 한다.
+# 각 모듈이 `from pico2d import *` 로 함수를 가져가기 때문에, 그 전에 pico2d 모듈의 함수를 바꿔 둔다.
+import struct
+
+import pico2d
+
+enabled = False
+_canvas_width = 0
+_canvas_height = 0
+
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+class HeadlessImage:
+    # 크기만 기억하는 이미지 대역. 그리기 함수는 아무것도 하지 않는다.
+    def __init__(self, w, h):
+        self.w = w
+        self.h = h
+
+    def draw(self, *args, **kwargs): pass
+    def draw_now(self, *args, **kwargs): pass
+    def draw_to_origin(self, *args, **kwargs): pass
+    def clip_draw(self, *args, **kwargs): pass
+    def clip_draw_to_origin(self, *args, **kwargs): pass
+    def rotate_draw(self, *args, **kwargs): pass
+    def composite_draw(self, *args, **kwargs): pass
+    def clip_composite_draw(self, *args, **kwargs): pass
+    def opacify(self, *args, **kwargs): pass
+
+
+class HeadlessFont:
+    def draw(self, *args, **kwargs): pass
+
+
+class HeadlessSound:
+    def play(self, *args, **kwargs): pass
+    def repeat_play(self, *args, **kwargs): pass
+    def stop(self, *args, **kwargs): pass
+    def set_volume(self, *args, **kwargs): pass
+    def get_volume(self): return 0
+
+
+def _image_size(path):
+    # PNG/JPEG 헤더에서 크기만 읽는다. 알 수 없는 형식은 (0, 0).
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(24)
+            if head[:8] == b'\x89PNG\r\n\x1a\n':
+                return struct.unpack('>II', head[16:24])
+            if head[:2] == b'\xff\xd8':
+                f.seek(2)
+                while True:
+                    marker = f.read(2)
+                    if len(marker) < 2 or marker[0] != 0xFF:
+                        break
+                    if marker[1] in _JPEG_SOF_MARKERS:
+                        f.read(3)
+                        h, w = struct.unpack('>HH', f.read(4))
+                        return w, h
+                    length = struct.unpack('>H', f.read(2))[0]
+                    f.seek(length - 2, 1)
+    except (OSError, struct.error):
+        pass
+    return 0, 0
+
+
+def _open_canvas(w=int(800), h=int(600), sync=False, full=False):
+    global _canvas_width, _canvas_height
+    _canvas_width, _canvas_height = w, h
+
+
+def _load_image(name):
+    return HeadlessImage(*_image_size(name))
+
+
+def install(width=1600, height=900):
+    global enabled
+    if enabled:
+        return
+    enabled = True
+    _open_canvas(width, height)
+
+    pico2d.open_canvas = _open_canvas
+    pico2d.close_canvas = lambda: None
+    pico2d.get_canvas_width = lambda: _canvas_width
+    pico2d.get_canvas_height = lambda: _canvas_height
+    pico2d.load_image = _load_image
+    pico2d.load_font = lambda name, size=20: HeadlessFont()
+    pico2d.load_music = lambda name: HeadlessSound()
+    pico2d.load_wav = lambda name: HeadlessSound()
+    pico2d.clear_canvas = lambda: None
+    pico2d.update_canvas = lambda: None
+    pico2d.get_events = lambda: []
+    pico2d.delay = lambda sec: None
+    pico2d.draw_rectangle = lambda *args: None
+
+    # 배경음은 로드/재생하지 않는다 (bgm 파일이 없는 스테이지도 헤드리스로 돌릴 수 있게).
+    # bgm_manager 는 위에서 바꾼 pico2d 를 가져가므로 여기서 import 해도 된다.
+    import bgm_manager
+    bgm_manager._play = lambda track_name: None
@@ -1,7 +1,44 @@
+import argparse
+
 from pico2d import *
+import collision_manager
+import frame_profiler
 import game_framework
-from modes import title_mode as start_mode
+import snapshot
+from modes import play_mode
+from modes import title_mode
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--fps", type=int, default=60, help="목표 프레임 수 (0 이면 제한 없음)")
+parser.add_argument("--vsync", action="store_true", help="모니터 vsync 로 프레임 속도 제한")
+parser.add_argument("--tick-rate", type=int, default=120, help="초당 고정 update 횟수")
+parser.add_argument("--max-frame-skip", type=int, default=2, help="느려질 때 연속으로 건너뛸 수 있는 draw 횟수 (0 이면 끔)")
+parser.add_argument("--profile", metavar="CSV", help="프레임 단계별 시간을 측정해 종료 시 CSV 로 저장")
+parser.add_argument("--seed", type=int, help="스테이지 난수 시드 (같은 시드면 같은 스폰/AI)")
+parser.add_argument("--record", metavar="PATH", help="스테이지 입력을 리플레이 파일로 녹화 ({stage}, {seed} 치환 가능)")
+parser.add_argument("--soa", action="store_true", help="NumPy 배열 기반 위치/이동 처리 사용 (NumPy 필요)")
+parser.add_argument("--broadphase", choices=["spatial_hash", "brute_force", "numpy"], default="spatial_hash", help="충돌 브로드페이즈")
+parser.add_argument("--snapshot", metavar="PATH", help="저장된 스냅샷(F5)에서 바로 플레이 시작")
+args = parser.parse_args()
 
-open_canvas(1600, 900)
+if args.profile:
+    frame_profiler.enable(dump_path=args.profile)
+
+play_mode.set_seed(args.seed)
+play_mode.set_soa(args.soa)
+collision_manager.set_default_broadphase(args.broadphase)
+start_mode = title_mode
+if args.snapshot:
+    play_mode.start_from_snapshot(snapshot.load(args.snapshot))
+    start_mode = play_mode
+if args.record:
+    play_mode.start_recording(args.record)
+game_framework.set_frame_pacing(args.fps or None, vsync=args.vsync)
+open_canvas(1600, 900, sync=game_framework.use_vsync)
+game_framework.set_fixed_step(args.tick_rate)
+game_framework.set_frame_skip(args.max_frame_skip)
 game_framework.run(start_mode)
-close_canvas()
\ No newline at end of file
+close_canvas()
+
+if args.profile:
+    print(f"frames drawn={game_framework.frames_drawn} skipped={game_framework.frames_skipped}")
@@ -0,0 +1,57 @@
+from pico2d import *
+
+import asset_loader
+import game_framework
+
+# 리소스 프리페치가 끝나지 않은 상태에서 모드를 바꿀 때 잠깐 보여주는 로딩 화면
+LOAD_BUDGET = 1.0 / 60.0  # 한 번의 update 에서 텍스처 생성에 쓸 시간
+
+target_mode = None
+assets = []
+
+
+def prepare(mode, mode_assets):
+    global target_mode, assets
+    target_mode = mode
+    assets = list(mode_assets)
+
+
+def init():
+    asset_loader.prefetch(assets)
+
+
+def finish():
+    global target_mode, assets
+    target_mode = None
+    assets = []
+
+
+def handle_events():
+    for event in get_events():
+        if event.type == SDL_QUIT:
+            game_framework.quit()
+
+
+def update():
+    asset_loader.pump(LOAD_BUDGET, force=True)
+    if asset_loader.is_ready(assets):
+        game_framework.change_mode(target_mode)
+
+
+def draw():
+    clear_canvas()
+    cw, ch = get_canvas_width(), get_canvas_height()
+    bar_w, bar_h = cw // 3, 24
+    left = (cw - bar_w) // 2
+    bottom = ch // 2 - bar_h // 2
+    draw_rectangle(left, bottom, left + bar_w, bottom + bar_h)
+    filled = int(bar_w * asset_loader.progress(assets))
+    if filled > 4:
+        draw_rectangle(left + 2, bottom + 2, left + filled - 2, bottom + bar_h - 2)
+    update_canvas()
+
+
+def pause(): pass
+
+
+def resume(): pass
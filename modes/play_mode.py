@@ -1,12 +1,17 @@
 from pico2d import *
 
 from common import resource_path
+import asset_loader
 import game_framework
 import game_world
 from modes import select_mode
 from modes import title_mode
 import camera
+import chunk_streamer
+import event_bus
 import bgm_manager
+import replay
+import snapshot
 
 from zag import Zag
 from monsters.goblin import Goblin
@@ -15,14 +20,37 @@ from monsters.slime import Slime
 from monsters.slime_king import SlimeKing
 from monsters.goblin_king import GoblinKing
 from background import Background
-from stage_definitions import STAGES
+from collision_manager import CollisionGroup
+from stage_definitions import STAGES, get_background_path
 from ui import GameUI
 
+VICTORY_IMAGE_PATH = resource_path('resource/Image/GUI/clear.png')
+DEFEAT_IMAGE_PATH = resource_path('resource/Image/GUI/defeat.png')
+RESULT_BACKGROUND_PATH = resource_path('resource/Image/GUI/clearEmptyImage.png')
+MONSTER_KILL_GOLD = 30
+
+world = None
 zag = None
 ui=None
 monsters = []
 game_running=True
 current_stage_data = None
+# 명령줄 등에서 지정한 난수 시드. None 이면 스테이지 정의의 "seed", 그것도 없으면 매번 다른 시드를 쓴다.
+seed_override = None
+# True 면 NumPy SoA 저장소로 위치/이동을 처리한다 (NumPy 가 없으면 무시)
+use_soa = False
+# 입력 녹화 경로 ({stage}, {seed} 사용 가능)와 재생 중인 리플레이
+record_path = None
+recorder = None
+replay_player = None
+# 녹화/재생의 시간 기준. 진행한 스텝 수를 세고, 스냅샷 복원(F9)으로 world.tick 이 되돌아가도 계속 증가한다.
+input_tick = 0
+# 게임이 쓰는 입력 이벤트 종류. 마우스 이동, 창 이벤트 등은 녹화하지도 넘기지도 않는다 (종료는 handle_events 가 따로 처리)
+INPUT_EVENT_TYPES = (SDL_KEYDOWN, SDL_KEYUP)
+# 스냅샷: 다음 init() 에서 복원할 상태와 현재 스테이지 시작 시점의 스냅샷 (즉시 재시작용)
+QUICKSAVE_PATH = 'quicksave.snap'
+pending_snapshot = None
+stage_start_snapshot = None
 victory_timer = 2.0
 defeat_timer = 2.0
 world_cleared = False
@@ -37,6 +65,8 @@ victory_background=None
 defeat_image=None
 defeat_background=None
 result_state = None
+# 이번 스텝 중 이벤트로 정해진 결과. 스텝이 끝난 뒤 update() 가 처리한다 ('defeat' 가 'victory' 보다 우선)
+stage_outcome = None
 
 def handle_events():
     event_list = get_events()
@@ -45,63 +75,227 @@ def handle_events():
             game_framework.quit()
         elif event.type == SDL_KEYDOWN and event.key == SDLK_ESCAPE:
             game_framework.quit()
-        else:
-            zag.handle_event(event)
+        elif replay_player is None and event.type in INPUT_EVENT_TYPES:
+            if recorder is not None:
+                recorder.record(input_tick, event)
+            _handle_input(event)
+
+    if replay_player is not None:
+        for event in replay_player.poll(input_tick):
+            _handle_input(event)
+
+
+def _handle_input(event):
+    # 녹화/재생되는 입력. F5/F9 도 녹화해서 재생할 때 같은 틱에 저장/재시작이 일어나게 한다.
+    if event.type == SDL_KEYDOWN and event.key == SDLK_F5:
+        # 현재 상태를 파일로 저장 (버그 재현/벤치마크 시작 지점용)
+        snapshot.save(QUICKSAVE_PATH, take_snapshot())
+        print(f"Snapshot saved: {QUICKSAVE_PATH}")
+    elif event.type == SDL_KEYDOWN and event.key == SDLK_F9:
+        restart_stage()
+    else:
+        zag.handle_event(event)
 
 def prepare_stage(stage_id):
     global current_stage_data
     current_stage_data = STAGES[stage_id]
 
 
+def set_seed(seed):
+    global seed_override
+    seed_override = seed
+
+
+def set_soa(enabled):
+    global use_soa
+    use_soa = enabled
+
+
+def start_recording(path):
+    # 이후 진입하는 스테이지마다 입력을 path 에 녹화한다.
+    global record_path
+    record_path = path
+
+
+def play_replay(records):
+    # 다음 init() 부터 실제 입력 대신 녹화된 입력을 사용한다.
+    global replay_player
+    replay_player = replay.ReplayPlayer(records)
+
+
+def capture_state():
+    # 월드(엔티티, 컴포넌트, BT/상태 머신, 투사체, 카메라, rng)와 play_mode 의 진행 상태
+    return {
+        "stage_id": current_stage_data["id"],
+        "world": world,
+        "zag": zag,
+        "monsters": monsters,
+        "game_running": game_running,
+        "result_state": result_state,
+        "victory_timer": victory_timer,
+        "defeat_timer": defeat_timer,
+        "world_cleared": world_cleared,
+        "stage_outcome": stage_outcome,
+        "persistent_player_state": dict(persistent_player_state),
+    }
+
+
+def restore_state(state):
+    global current_stage_data, world, zag, monsters, game_running, result_state
+    global victory_timer, defeat_timer, world_cleared, stage_outcome
+    current_stage_data = STAGES[state["stage_id"]]
+    world = game_world.use(state["world"])
+    # 저장할 때와 화면 크기가 다를 수 있으므로 경계를 다시 계산한다.
+    world.bounds.refresh()
+    zag = state["zag"]
+    monsters = state["monsters"]
+    game_running = state["game_running"]
+    result_state = state["result_state"]
+    victory_timer = state["victory_timer"]
+    defeat_timer = state["defeat_timer"]
+    world_cleared = state["world_cleared"]
+    stage_outcome = state["stage_outcome"]
+    persistent_player_state.update(state["persistent_player_state"])
+
+
+def take_snapshot():
+    return snapshot.dumps(capture_state())
+
+
+def restore_snapshot(blob):
+    restore_state(snapshot.loads(blob))
+
+
+def start_from_snapshot(blob):
+    # 다음 init() 에서 스테이지를 새로 만들지 않고 스냅샷 상태에서 시작한다.
+    # 복원하면서 이미지를 읽으므로 풀기는 캔버스가 열린 뒤 init() 에서 한다.
+    global pending_snapshot
+    pending_snapshot = blob
+
+
+def restart_stage():
+    # 스테이지 시작 시점으로 즉시 되돌린다 (객체를 다시 만들지 않음).
+    # input_tick 은 그대로 두므로 녹화 중이어도 레코드의 틱은 계속 증가한다.
+    if stage_start_snapshot is not None:
+        restore_snapshot(stage_start_snapshot)
+
+
+def required_assets(stage_id=None):
+    # 스테이지 진입 전에 미리 읽어 둘 이미지 목록
+    stage_data = STAGES[stage_id] if stage_id is not None else current_stage_data
+    if stage_data is None:
+        stage_data = STAGES[1]
+
+    assets = [VICTORY_IMAGE_PATH, DEFEAT_IMAGE_PATH, RESULT_BACKGROUND_PATH, *GameUI.ASSETS, *Zag.ASSETS]
+    assets.append(get_background_path(stage_data["background"]))
+    for mob_info in stage_data["monsters"]:
+        assets.extend(get_monster_class(mob_info["type"]).ASSETS)
+    return list(dict.fromkeys(assets))
+
+
 def init():
     global victory_image, victory_background, victory_timer, defeat_image, defeat_background, defeat_timer, result_state, world_cleared
+    global world, zag, monsters, game_running, pending_snapshot, stage_start_snapshot, stage_outcome
+    restored = None
+    if pending_snapshot is not None:
+        restored = snapshot.loads(pending_snapshot)
+        pending_snapshot = None
+        prepare_stage(restored["stage_id"])
     if current_stage_data is None:
         prepare_stage(1)
-    image_path = resource_path('resource/Image/GUI/clear.png')
-    victory_image = load_image(image_path)
-    victory_background_path = resource_path('resource/Image/GUI/clearEmptyImage.png')
-    victory_background = load_image(victory_background_path)
+    victory_image = asset_loader.load_image(VICTORY_IMAGE_PATH)
+    victory_background = asset_loader.load_image(RESULT_BACKGROUND_PATH)
     victory_timer = 2.0
 
-    defeat_path = resource_path('resource/Image/GUI/defeat.png')
-    defeat_image = load_image(defeat_path)
-    defeat_background_path = resource_path('resource/Image/GUI/clearEmptyImage.png')
-    defeat_background = load_image(defeat_background_path)
+    defeat_image = asset_loader.load_image(DEFEAT_IMAGE_PATH)
+    defeat_background = asset_loader.load_image(RESULT_BACKGROUND_PATH)
     defeat_timer = 2.0
     result_state = None
+    stage_outcome = None
     world_cleared = False
 
     bgm_manager.play_stage_bgm(current_stage_data["id"])
 
-    game_world.camera = camera.Camera(1600,900)
-
-    global zag
-    # 플레이어가 패배 후 제목 화면으로 돌아갔다 다시 시작할 때
-    # 남아 있던 상태(HP 0 등) 때문에 즉시 패배 화면이 뜨는 문제를 방지합니다.
-    # 매ステ이지 시작 시 새 플레이어 객체를 생성해 완전히 초기화합니다.
-    zag = Zag()
-    _load_player_state()
-    game_world.add_object(zag, 1)
-    _spawn_stage_monsters()
-
-    global background
-    background = Background(current_stage_data["background"])
-    game_world.add_object(background, 0)
-    global game_running
-    game_running=True
+    if restored is not None:
+        restore_state(restored)
+    else:
+        # 플레이어가 패배 후 제목 화면으로 돌아갔다 다시 시작할 때
+        # 남아 있던 상태(HP 0 등) 때문에 즉시 패배 화면이 뜨는 문제를 방지합니다.
+        # 매 스테이지 시작 시 새 월드와 플레이어 객체를 생성해 완전히 초기화합니다.
+        seed = seed_override if seed_override is not None else current_stage_data.get("seed")
+        world, zag, monsters = create_stage_world(current_stage_data, seed)
+        if world.live.group(CollisionGroup.MONSTER) == 0:
+            # 몬스터가 없는 스테이지는 사망 이벤트가 오지 않으므로 첫 스텝에서 바로 승리 처리한다.
+            _set_outcome('victory')
+        _load_player_state()
+        game_running = True
+    stage_start_snapshot = take_snapshot()
+
+    global recorder, input_tick
+    input_tick = 0
+    if record_path and restored is not None:
+        # 스냅샷 상태는 시드로 다시 만들 수 없으므로 재현 가능한 리플레이가 되지 않는다.
+        print("Recording disabled: stage started from a snapshot.")
+    elif record_path and replay_player is None:
+        path = record_path.format(stage=current_stage_data["id"], seed=world.rng.seed)
+        recorder = replay.ReplayRecorder(path, world.rng.seed, current_stage_data["id"], game_framework.fixed_time_step)
 
     global ui
     ui=GameUI()
 
-def _spawn_stage_monsters():
-    global monsters
-    monsters = []
-    for mob_info in current_stage_data["monsters"]:
+def create_stage_world(stage_data, seed=None):
+    # 스테이지 하나를 담는 World 를 만들어 활성화하고 플레이어, 몬스터, 배경을 배치한다.
+    # 월드의 rng 는 seed 로 초기화되므로 같은 seed 면 스폰 위치와 AI 선택이 같다.
+    # "size" 가 있는 큰 스테이지는 청크 단위로 나눠 카메라 주변만 로드한다.
+    size = stage_data.get("size")
+    stage_world = game_world.use(game_world.World(seed, use_soa, size))
+    stage_world.camera = camera.Camera(stage_world.bounds)
+    if size:
+        stage_world.streamer = chunk_streamer.ChunkStreamer(stage_world, stage_data.get("chunk_size"))
+    stage_world.events.subscribe(event_bus.ENTITY_DIED, _on_entity_died)
+    stage_world.events.subscribe(event_bus.PLAYER_DIED, _on_player_died)
+
+    player = Zag()
+    stage_world.add_object(player, 1)
+    stage_monsters = _spawn_stage_monsters(stage_world, stage_data)
+    stage_world.add_object(Background(stage_data["background"]), 0)
+    if stage_world.streamer is not None:
+        # 첫 스텝 전에 먼 청크를 내려 둔다.
+        stage_world.camera.update(player)
+        stage_world.update_streaming()
+    return stage_world, player, stage_monsters
+
+
+def _spawn_stage_monsters(stage_world, stage_data):
+    stage_monsters = []
+    for mob_info in stage_data["monsters"]:
         mob_class = get_monster_class(mob_info["type"])
         for _ in range(mob_info["count"]):
             monster = mob_class()
-            monsters.append(monster)
-            game_world.add_object(monster, 1)
+            stage_monsters.append(monster)
+            stage_world.add_object(monster, 1)
+    return stage_monsters
+
+
+def _on_entity_died(entity, group):
+    if group != CollisionGroup.MONSTER:
+        return
+    stage_world = entity.world
+    for player in stage_world.player:
+        if hasattr(player, "gold"):
+            player.gold += MONSTER_KILL_GOLD
+    if stage_world.live.group(CollisionGroup.MONSTER) == 0:
+        _set_outcome('victory')
+
+
+def _on_player_died(player):
+    _set_outcome('defeat')
+
+
+def _set_outcome(outcome):
+    global stage_outcome
+    if stage_outcome != 'defeat':
+        stage_outcome = outcome
 
 
 def get_monster_class(monster_type: str):
@@ -119,17 +313,16 @@ MONSTER_TYPES = {
     "GoblinKing": GoblinKing,
 }
 
-MONSTER_CLASS_TUPLE = tuple(set(MONSTER_TYPES.values()))
 
 def update():
-    global game_running, victory_timer, defeat_timer, result_state, world_cleared
+    global input_tick, game_running, victory_timer, defeat_timer, result_state, world_cleared
     if not game_running:
         if result_state == 'victory':
             victory_timer -= game_framework.frame_time
             if victory_timer <= 0:
                 if not world_cleared:
                     _save_player_state()
-                    game_world.clear()
+                    world.clear()
                     world_cleared = True
                 game_framework.change_mode(select_mode)
         elif result_state == 'defeat':
@@ -137,48 +330,33 @@ def update():
             if defeat_timer <= 0:
                 if not world_cleared:
                     _save_player_state()
-                    game_world.clear()
+                    world.clear()
                     world_cleared = True
                 game_framework.change_mode(title_mode)
 
         return
 
-    for layer in game_world.world:
-        for o in layer[:]:  # 2. (안전성을 위해) 리스트의 복사본 순회
-
-            if isinstance(o, MONSTER_CLASS_TUPLE):
-                o.update(zag)
-            else:
-                o.update()
+    world.step(game_framework.frame_time, zag)
+    input_tick += 1
 
-    if game_world.camera:
-        game_world.camera.update(zag)
-    game_world.handle_collisions()
-
-    if zag and zag.hp <= 0:
+    if stage_outcome == 'defeat':
         game_running = False
         result_state = 'defeat'
         defeat_timer = 2.0
+        # 결과 화면이 떠 있는 동안 다음 모드의 리소스를 미리 읽어 둔다.
+        asset_loader.prefetch(title_mode.required_assets())
         bgm_manager.stop_bgm()
         if not world_cleared:
             _save_player_state()
-            game_world.clear()
+            world.clear()
             world_cleared = True
         return
 
-    monster_exists = False
-    for layer in game_world.world:
-        for obj in layer:
-            if isinstance(obj, MONSTER_CLASS_TUPLE):
-                monster_exists = True
-                break
-        if monster_exists:
-            break
-
-    if not monster_exists:
+    if stage_outcome == 'victory':
         game_running = False
         victory_timer=2.0
         result_state = 'victory'
+        asset_loader.prefetch(select_mode.required_assets())
         _save_player_state()
         bgm_manager.stop_bgm()
         print("Victory! All monsters defeated.")
@@ -189,7 +367,7 @@ def draw():
     if game_running:
         # 1. 게임이 실행 중일 때만 (평상시)
         #    게임 월드(플레이어, 몬스터, HP 바 등)를 그립니다.
-        game_world.render()
+        world.render()
         ui.draw(zag)
     else:
         # 2. 게임이 멈췄을 때 (승리/패배)
@@ -205,8 +383,13 @@ def draw():
 
 
 def finish():
+    global recorder
     bgm_manager.stop_bgm()
-    game_world.clear()
+    if recorder is not None:
+        recorder.close()
+        recorder = None
+    if world is not None:
+        world.clear()
 
 
 def _save_player_state():
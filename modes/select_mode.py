@@ -1,4 +1,5 @@
 from pico2d import *
+import asset_loader
 import game_framework
 
 from common import resource_path
@@ -6,22 +7,31 @@ from modes import play_mode
 from stage_icon import StageIcon
 from ui_icon import ShopIcon
 import bgm_manager
+from stage_definitions import STAGES
+
+BACKGROUND_PATH = resource_path('resource/Image/GUI/clearEmptyImage.png')
+ICON1_PATH = resource_path('resource/Image/GUI/Stage/Icon/b1-1.png')
+ICON2_PATH = resource_path('resource/Image/GUI/Stage/Icon/b2-1.png')
+SHOP_ICON_PATH = resource_path('resource/Image/GUI/shop.png')
 
 # 3. 이 모드에서 사용할 객체 리스트
 stage_icons = []
 background = None
 
 
+def required_assets():
+    return [BACKGROUND_PATH, ICON1_PATH, ICON2_PATH, SHOP_ICON_PATH]
+
+
 def init():
     global background, stage_icons
 
     # 배경 이미지 로드
-    background_path = resource_path('resource/Image/GUI/clearEmptyImage.png')
-    background = load_image(background_path)
+    background = asset_loader.load_image(BACKGROUND_PATH)
     bgm_manager.play_select_bgm()
-    icon1_path=resource_path('resource/Image/GUI/Stage/Icon/b1-1.png')
-    icon2_path=resource_path('resource/Image/GUI/Stage/Icon/b2-1.png')
-    shop_icon_path=resource_path('resource/Image/GUI/shop.png')
+    icon1_path = ICON1_PATH
+    icon2_path = ICON2_PATH
+    shop_icon_path = SHOP_ICON_PATH
 
     # 스테이지 아이콘 객체 생성
     center_x, center_y = get_canvas_width() // 2, get_canvas_height() // 2
@@ -33,6 +43,10 @@ def init():
         ShopIcon(center_x, center_y - 200, shop_icon_path)
     ]
 
+    # 스테이지를 고르는 동안 각 스테이지의 리소스를 백그라운드에서 미리 읽어 둔다.
+    for stage_id in STAGES:
+        asset_loader.prefetch(play_mode.required_assets(stage_id))
+
 
 def handle_events():
     event_list = get_events()
@@ -1,13 +1,21 @@
-from pico2d import clear_canvas, get_canvas_height, get_canvas_width, get_events, load_font, load_image, update_canvas
+from pico2d import clear_canvas, get_canvas_height, get_canvas_width, get_events, update_canvas
 from sdl2 import SDL_BUTTON_LEFT, SDL_KEYDOWN, SDL_MOUSEBUTTONDOWN, SDL_QUIT, SDLK_ESCAPE
 
 from common import resource_path
+import asset_loader
 import game_framework
 import game_world
 import bgm_manager
 from modes import play_mode
 from zag import Zag
 
+BACKGROUND_PATH = resource_path("resource/Image/GUI/clearEmptyImage.png")
+FONT_PATH = resource_path("ENCR10B.TTF")
+item_dir = "resource/Image/GUI/Item"
+COIN_PATH = resource_path(f"{item_dir}/bar_coin.png")
+HP_POTION_PATH = resource_path(f"{item_dir}/hp_potion.png")
+MP_POTION_PATH = resource_path(f"{item_dir}/mp_potion.png")
+
 class ShopMode:
     def __init__(self):
         self.player = None
@@ -18,17 +26,19 @@ class ShopMode:
         self.mp_image = None
         self.shop_items = []
 
+    def required_assets(self):
+        # 상점에서 Zag 를 새로 만들 수 있으므로 Zag 리소스도 함께 준비한다.
+        return [BACKGROUND_PATH, COIN_PATH, HP_POTION_PATH, MP_POTION_PATH, *Zag.ASSETS]
+
     def init(self):
         self.player = self._get_or_create_player()
-        background_path = resource_path("resource/Image/GUI/clearEmptyImage.png")
-        self.background = load_image(background_path)
-        self.font = load_font(resource_path("ENCR10B.TTF"), 30)
+        self.background = asset_loader.load_image(BACKGROUND_PATH)
+        self.font = asset_loader.load_font(FONT_PATH, 30)
         bgm_manager.play_select_bgm()
 
-        item_dir = "resource/Image/GUI/Item"
-        self.coin_image = load_image(resource_path(f"{item_dir}/bar_coin.png"))
-        self.hp_image = load_image(resource_path(f"{item_dir}/hp_potion.png"))
-        self.mp_image = load_image(resource_path(f"{item_dir}/mp_potion.png"))
+        self.coin_image = asset_loader.load_image(COIN_PATH)
+        self.hp_image = asset_loader.load_image(HP_POTION_PATH)
+        self.mp_image = asset_loader.load_image(MP_POTION_PATH)
 
         self.shop_items = [
             {
@@ -48,8 +58,8 @@ class ShopMode:
         ]
 
     def _get_or_create_player(self):
-        if game_world.player:
-            return game_world.player[0]
+        if game_world.current.player:
+            return game_world.current.player[0]
 
         if getattr(play_mode, "zag", None) is not None:
             return play_mode.zag
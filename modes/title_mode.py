@@ -2,18 +2,25 @@ from pico2d import *
 import os
 
 from common import resource_path
+import asset_loader
 import game_framework
 from modes import select_mode
 import bgm_manager
 image = None
+IMAGE_PATH = resource_path('resource/Image/GUI/UI_TITLE_TITLE.jpg')
+
+def required_assets():
+    return [IMAGE_PATH]
 
 def init():
     global image
-    image_path = resource_path('resource/Image/GUI/UI_TITLE_TITLE.jpg')
+    image_path = IMAGE_PATH
     if not os.path.exists(image_path):
         raise FileNotFoundError(f"Image not found: `{image_path}`")
-    image = load_image(image_path)
+    image = asset_loader.load_image(image_path)
     bgm_manager.play_title_bgm()
+    # 타이틀 화면을 보는 동안 스테이지 선택 화면 리소스를 미리 읽는다.
+    asset_loader.prefetch(select_mode.required_assets())
 def finish():
     global image
     del image
@@ -1,14 +1,11 @@
 import math
 import os
-import random
-
-from pico2d import load_image, get_canvas_height, get_canvas_width
 
 from common import resource_path
-import game_framework
-import game_world
+import asset_loader
 from behavior_tree import Action, BehaviorTree, Condition, Selector, Sequence
 from collision_manager import CollisionGroup
+from components.component_ai_lod import AILodComponent
 from components.component_combat import CombatComponent
 from components.component_collision import CollisionComponent
 from components.component_hud import HUDComponent
@@ -36,24 +33,33 @@ DETECTION_RANGE = 220
 PATROL_RADIUS = 140
 HITBOX_EXTRA = 20
 
+IMAGE_PATH = resource_path("resource/Image/Monster/Goblin.png")
+
+# AI LOD 거리(px)
+AI_LOD_NEAR = 700
+AI_LOD_FAR = 1300
+
 
 class Goblin(GameObject):
+    ASSETS = [IMAGE_PATH, *HUDComponent.ASSETS]
+
     def __init__(self):
         super().__init__()
 
-        image_path = resource_path("resource/Image/Monster/Goblin.png")
+        image_path = IMAGE_PATH
         if not os.path.exists(image_path):
             raise FileNotFoundError(f"Image not found: `{image_path}`")
 
-        start_x = random.randint(140, max(150, get_canvas_width() - 140))
+        spawn = self.world.bounds.spawn
+        start_x = self.world.rng.spawn.randint(140, max(150, spawn.right - 140))
         start_y_lower = 140
-        start_y_upper = max(start_y_lower + 1, get_canvas_height() - start_y_lower)
-        start_y = random.randint(start_y_lower, start_y_upper)
+        start_y_upper = max(start_y_lower + 1, spawn.top - start_y_lower)
+        start_y = self.world.rng.spawn.randint(start_y_lower, start_y_upper)
 
         self.transform = self.add_component(
             TransformComponent(start_x, start_y, FRAME_W * SCALE, FRAME_H * SCALE)
         )
-        self.sprite = self.add_component(SpriteComponent(load_image(image_path), FRAME_W, FRAME_H))
+        self.sprite = self.add_component(SpriteComponent(asset_loader.load_image(image_path), FRAME_W, FRAME_H))
         self.collision_group = CollisionGroup.MONSTER
         self.base_collision_w = self.transform.w - 10
         self.collision = self.add_component(
@@ -67,9 +73,10 @@ class Goblin(GameObject):
         self.combat = self.add_component(CombatComponent(20))
         self.movement = self.add_component(MovementComponent(90))
         self.perception = self.add_component(PerceptionComponent())
+        self.ai_lod = self.add_component(AILodComponent(AI_LOD_NEAR, AI_LOD_FAR))
         self.hud = self.add_component(HUDComponent())
 
-        self.dir = random.choice([-1, 1])
+        self.dir = self.world.rng.ai.choice([-1, 1])
         self.movement.xdir = self.dir
         self._update_sprite_flip()
 
@@ -144,7 +151,7 @@ class Goblin(GameObject):
 
     def update(self, target=None):
         if self.hp <= 0:
-            game_world.remove_object(self)
+            self.world.remove_object(self)
             return
 
         self.perception.target = target
@@ -154,7 +161,7 @@ class Goblin(GameObject):
         super().update()
 
     def handle_patrol(self):
-        dt = game_framework.frame_time
+        dt = self.world.dt
         self.cooldown_timer = min(ATTACK_COOLDOWN, self.cooldown_timer + dt)
 
         if self.x <= self.patrol_left:
@@ -224,7 +231,7 @@ class Goblin(GameObject):
         self.dash_done = False
 
     def _update_prepare(self):
-        dt = game_framework.frame_time
+        dt = self.world.dt
         self.prepare_timer += dt
         if self.prepare_timer >= PREPARE_TIME:
             self._start_attack()
@@ -254,7 +261,7 @@ class Goblin(GameObject):
         self.dash_done = True
 
     def _update_attack(self):
-        dt = game_framework.frame_time
+        dt = self.world.dt
         self.attack_anim_timer += dt
 
         progress = min(1.0, self.attack_anim_timer / ATTACK_ANIM_DURATION)
@@ -270,7 +277,7 @@ class Goblin(GameObject):
         self.collision.override_width = self.base_collision_w
 
     def _update_cooldown(self):
-        dt = game_framework.frame_time
+        dt = self.world.dt
         self.cooldown_timer += dt
         if self.cooldown_timer >= ATTACK_COOLDOWN:
             self.state = "patrol"
@@ -288,10 +295,13 @@ class Goblin(GameObject):
             return BehaviorTree.RUNNING if self.state != "patrol" else BehaviorTree.SUCCESS
         return BehaviorTree.FAIL
 
-    def handle_collision(self, other):
+    def on_collision_enter(self, other):
         if getattr(other, "collision_group", None) == CollisionGroup.PROJECTILE:
             self._enter_hit(other)
-        elif getattr(other, "collision_group", None) == CollisionGroup.PLAYER and self.state == "attack":
+
+    def handle_collision(self, other):
+        # 공격은 플레이어와 이미 닿아 있는 상태에서 시작될 수 있으므로 매 프레임 확인한다.
+        if getattr(other, "collision_group", None) == CollisionGroup.PLAYER and self.state == "attack":
             if not self.attack_hit_registered:
                 combat = getattr(other, "combat", None)
                 if combat:
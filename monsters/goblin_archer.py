@@ -1,13 +1,10 @@
 import os
-import random
-
-from pico2d import get_canvas_height, get_canvas_width, load_image
 
 from common import resource_path
-import game_framework
-import game_world
+import asset_loader
 from behavior_tree import Action, BehaviorTree, Condition, Selector, Sequence
 from collision_manager import CollisionGroup
+from components.component_ai_lod import AILodComponent
 from components.component_combat import CombatComponent
 from components.component_collision import CollisionComponent
 from components.component_hud import HUDComponent
@@ -36,16 +33,29 @@ PATROL_RADIUS = 160
 ARROW_SPEED = 400
 ARROW_SIZE = (80,10)
 
+IMAGE_PATH = resource_path("resource/Image/Monster/Goblin Archer.png")
+ARROW_IMAGE_PATH = resource_path("resource/Image/Projectile/arrow.png")
+
+# AI LOD 거리(px). 사거리가 길어서 일반 고블린보다 조금 멀리까지 매 스텝 update
+AI_LOD_NEAR = 800
+AI_LOD_FAR = 1400
+
 
 class Arrow(Projectile):
+    ASSETS = [ARROW_IMAGE_PATH]
     _arrow_image = None
+    continuous_collision = True
 
-    def __init__(self, x, y, direction):
+    @staticmethod
+    def _load_image():
         if Arrow._arrow_image is None:
-            image_path = resource_path("resource/Image/Projectile/arrow.png")
+            image_path = ARROW_IMAGE_PATH
             if not os.path.exists(image_path):
                 raise FileNotFoundError(f"Arrow image not found: `{image_path}`")
-            Arrow._arrow_image = load_image(image_path)
+            Arrow._arrow_image = asset_loader.load_image(image_path)
+        return Arrow._arrow_image
+
+    def __init__(self, x, y, direction):
         width, height = ARROW_SIZE
         super().__init__(
             x,
@@ -55,7 +65,24 @@ class Arrow(Projectile):
             damage=ATTACK_DAMAGE,
             width=width,
             height=height,
-            image=Arrow._arrow_image,
+            image=Arrow._load_image(),
+            collision_mask=CollisionGroup.PLAYER,
+            knockback_x=120,
+            knockback_y=200,
+        )
+
+    def reset(self, x, y, direction):
+        # 스냅샷에서 복원된 풀 객체는 __init__ 을 거치지 않았으므로 여기서도 이미지를 확인한다.
+        width, height = ARROW_SIZE
+        self.launch(
+            x,
+            y,
+            direction,
+            speed=ARROW_SPEED,
+            damage=ATTACK_DAMAGE,
+            width=width,
+            height=height,
+            image=Arrow._load_image(),
             collision_mask=CollisionGroup.PLAYER,
             knockback_x=120,
             knockback_y=200,
@@ -63,22 +90,25 @@ class Arrow(Projectile):
 
 
 class GoblinArcher(GameObject):
+    ASSETS = [IMAGE_PATH, *Arrow.ASSETS, *HUDComponent.ASSETS]
+
     def __init__(self):
         super().__init__()
 
-        image_path = resource_path("resource/Image/Monster/Goblin Archer.png")
+        image_path = IMAGE_PATH
         if not os.path.exists(image_path):
             raise FileNotFoundError(f"Image not found: `{image_path}`")
 
-        start_x = random.randint(140, max(150, get_canvas_width() - 140))
+        spawn = self.world.bounds.spawn
+        start_x = self.world.rng.spawn.randint(140, max(150, spawn.right - 140))
         start_y_lower = 160
-        start_y_upper = max(start_y_lower + 1, get_canvas_height() - start_y_lower)
-        start_y = random.randint(start_y_lower, start_y_upper)
+        start_y_upper = max(start_y_lower + 1, spawn.top - start_y_lower)
+        start_y = self.world.rng.spawn.randint(start_y_lower, start_y_upper)
 
         self.transform = self.add_component(
             TransformComponent(start_x, start_y, FRAME_W * SCALE, FRAME_H * SCALE)
         )
-        self.sprite = self.add_component(SpriteComponent(load_image(image_path), FRAME_W, FRAME_H))
+        self.sprite = self.add_component(SpriteComponent(asset_loader.load_image(image_path), FRAME_W, FRAME_H))
         self.collision_group = CollisionGroup.MONSTER
         self.base_collision_w = self.transform.w - 8
         self.collision = self.add_component(
@@ -92,9 +122,10 @@ class GoblinArcher(GameObject):
         self.combat = self.add_component(CombatComponent(15))
         self.movement = self.add_component(MovementComponent(80))
         self.perception = self.add_component(PerceptionComponent())
+        self.ai_lod = self.add_component(AILodComponent(AI_LOD_NEAR, AI_LOD_FAR))
         self.hud = self.add_component(HUDComponent())
 
-        self.dir = random.choice([-1, 1])
+        self.dir = self.world.rng.ai.choice([-1, 1])
         self.movement.xdir = self.dir
         self._update_sprite_flip()
 
@@ -164,7 +195,7 @@ class GoblinArcher(GameObject):
 
     def update(self, target=None):
         if self.hp <= 0:
-            game_world.remove_object(self)
+            self.world.remove_object(self)
             return
 
         self.perception.target = target
@@ -174,7 +205,7 @@ class GoblinArcher(GameObject):
         super().update()
 
     def handle_patrol(self):
-        dt = game_framework.frame_time
+        dt = self.world.dt
         self.cooldown_timer = min(ATTACK_COOLDOWN, self.cooldown_timer + dt)
 
         if self.x <= self.patrol_left:
@@ -228,7 +259,7 @@ class GoblinArcher(GameObject):
         self.frame = 3
 
     def _update_prepare(self):
-        dt = game_framework.frame_time
+        dt = self.world.dt
         self.prepare_timer += dt
         if self.prepare_timer >= PREPARE_TIME:
             self._start_attack()
@@ -240,7 +271,7 @@ class GoblinArcher(GameObject):
         self.arrow_fired = False
 
     def _update_attack(self):
-        dt = game_framework.frame_time
+        dt = self.world.dt
         self.attack_anim_timer += dt
 
         progress = min(1.0, self.attack_anim_timer / ATTACK_ANIM_DURATION)
@@ -263,11 +294,11 @@ class GoblinArcher(GameObject):
         else:
             dx, dy = self.dir, 0
 
-        arrow = Arrow(self.x + self.dir * (self.transform.w * 0.4), self.y, (dx, dy))
-        game_world.add_object(arrow, 1)
+        arrow = self.world.pools.acquire(Arrow, self.x + self.dir * (self.transform.w * 0.4), self.y, (dx, dy))
+        self.world.add_object(arrow, 1)
 
     def _update_cooldown(self):
-        dt = game_framework.frame_time
+        dt = self.world.dt
         self.cooldown_timer += dt
         if self.cooldown_timer >= ATTACK_COOLDOWN:
             self.state = "patrol"
@@ -287,10 +318,13 @@ class GoblinArcher(GameObject):
             )
         return BehaviorTree.FAIL
 
-    def handle_collision(self, other):
+    def on_collision_enter(self, other):
+        # 투사체 피격은 처음 닿은 순간 한 번만
         if getattr(other, "collision_group", None) == CollisionGroup.PROJECTILE:
             self._enter_hit(other)
-        elif getattr(other, "collision_group", None) == CollisionGroup.PLAYER:
+
+    def handle_collision(self, other):
+        if getattr(other, "collision_group", None) == CollisionGroup.PLAYER:
             combat = getattr(other, "combat", None)
             if combat:
                 combat.take_damage(8)
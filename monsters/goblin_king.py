@@ -1,13 +1,10 @@
 import math
 import os
-import random
-
-from pico2d import get_canvas_width, get_canvas_height, load_image
 
 from common import resource_path
-import game_framework
-import game_world
+import asset_loader
 from collision_manager import CollisionGroup
+from components.component_ai_lod import AILodComponent
 from components.component_combat import CombatComponent
 from components.component_collision import CollisionComponent
 from components.component_hud import HUDComponent
@@ -56,24 +53,49 @@ BOMB_ATTACK_RANGE = 260.0
 
 SCALE = 2
 
+img_dir = "resource/Image/Monster"
+IDLE_PATH = resource_path(f"{img_dir}/GoblinKingIdle.png")
+HIT_PATH = resource_path(f"{img_dir}/Goblin KingHit.png")
+BOMB_PATH = resource_path(f"{img_dir}/GoblinKing Bomb.png")
+GUN_PATH = resource_path(f"{img_dir}/GoblinKing Att.png")
+BACK_PATH = resource_path(f"{img_dir}/GoblinKing BackRun.png")
+BOMB_PROJ_PATH = resource_path(f"{img_dir}/bomb.png")
+MISSILE_PATH = resource_path(f"{img_dir}/GoblinKingMissile.png")
+EXPLOSION_PATHS = [
+    resource_path(f"{img_dir}/hit_4x4_1.png"),
+    resource_path(f"{img_dir}/hit_4x4_2.png"),
+    resource_path(f"{img_dir}/hit_4x4_3.png"),
+]
+
+# AI LOD 거리(px). 보스라서 넓게 잡는다
+AI_LOD_NEAR = 1200
+AI_LOD_FAR = 2400
+
 
 class GoblinKing(GameObject):
+    ASSETS = [
+        IDLE_PATH,
+        HIT_PATH,
+        BOMB_PATH,
+        GUN_PATH,
+        BACK_PATH,
+        BOMB_PROJ_PATH,
+        MISSILE_PATH,
+        *EXPLOSION_PATHS,
+        *HUDComponent.ASSETS,
+    ]
+
     def __init__(self):
         super().__init__()
-        img_dir = "resource/Image/Monster"
-
-        idle_path = resource_path(f"{img_dir}/GoblinKingIdle.png")
-        hit_path = resource_path(f"{img_dir}/Goblin KingHit.png")
-        bomb_path = resource_path(f"{img_dir}/GoblinKing Bomb.png")
-        gun_path = resource_path(f"{img_dir}/GoblinKing Att.png")
-        back_path = resource_path(f"{img_dir}/GoblinKing BackRun.png")
-        bomb_proj_path = resource_path(f"{img_dir}/bomb.png")
-        missile_path = resource_path(f"{img_dir}/GoblinKingMissile.png")
-        explosion_paths = [
-            resource_path(f"{img_dir}/hit_4x4_1.png"),
-            resource_path(f"{img_dir}/hit_4x4_2.png"),
-            resource_path(f"{img_dir}/hit_4x4_3.png"),
-        ]
+
+        idle_path = IDLE_PATH
+        hit_path = HIT_PATH
+        bomb_path = BOMB_PATH
+        gun_path = GUN_PATH
+        back_path = BACK_PATH
+        bomb_proj_path = BOMB_PROJ_PATH
+        missile_path = MISSILE_PATH
+        explosion_paths = EXPLOSION_PATHS
 
         if not all(os.path.exists(p) for p in [
             idle_path,
@@ -87,17 +109,18 @@ class GoblinKing(GameObject):
         ]):
             raise FileNotFoundError("GoblinKing sprite resources are missing")
 
-        self.idle_image = load_image(idle_path)
-        self.hit_image = load_image(hit_path)
-        self.bomb_image = load_image(bomb_path)
-        self.gun_image = load_image(gun_path)
-        self.back_image = load_image(back_path)
-        self.bomb_proj_image = load_image(bomb_proj_path)
-        self.missile_image = load_image(missile_path)
-        self.explosion_images = [load_image(p) for p in explosion_paths]
+        self.idle_image = asset_loader.load_image(idle_path)
+        self.hit_image = asset_loader.load_image(hit_path)
+        self.bomb_image = asset_loader.load_image(bomb_path)
+        self.gun_image = asset_loader.load_image(gun_path)
+        self.back_image = asset_loader.load_image(back_path)
+        self.bomb_proj_image = asset_loader.load_image(bomb_proj_path)
+        self.missile_image = asset_loader.load_image(missile_path)
+        self.explosion_images = [asset_loader.load_image(p) for p in explosion_paths]
 
-        start_x = random.randint(200, max(220, get_canvas_width() - 200))
-        start_y = random.randint(int(get_canvas_height() * 1.4), get_canvas_height() * 2 - 250)
+        bounds = self.world.bounds
+        start_x = self.world.rng.spawn.randint(200, max(220, bounds.spawn.right - 200))
+        start_y = self.world.rng.spawn.randint(int(bounds.height * 0.7), bounds.height - 250)
 
         self.transform = self.add_component(
             TransformComponent(
@@ -124,6 +147,7 @@ class GoblinKing(GameObject):
         self.base_speed = 120
         self.movement = self.add_component(MovementComponent(self.base_speed))
         self.perception = self.add_component(PerceptionComponent())
+        self.ai_lod = self.add_component(AILodComponent(AI_LOD_NEAR, AI_LOD_FAR))
         self.hud = self.add_component(HUDComponent(hp_width=90, hp_height=10, hp_offset=80))
 
         self.dir = -1
@@ -182,18 +206,17 @@ class GoblinKing(GameObject):
         return abs(self.vertical_velocity) > 1e-3
 
     def _prefer_bombs_only(self):
-        canvas_height = get_canvas_height()
-        return self.transform.y >= canvas_height * HIGH_ALTITUDE_RATIO
+        return self.transform.y >= self.world.bounds.view_h * HIGH_ALTITUDE_RATIO
 
     def update(self, zag=None):
         if self.hp <= 0:
-            game_world.remove_object(self)
+            self.world.remove_object(self)
             return
 
         self.perception.target = zag
 
         if self.hit_timer > 0:
-            self.hit_timer -= game_framework.frame_time
+            self.hit_timer -= self.world.dt
             if self.hit_timer <= 0:
                 self.state = self.prev_state
                 self._restore_animation_for_state()
@@ -209,12 +232,12 @@ class GoblinKing(GameObject):
         elif self.state == "hit":
             pass
 
-        self.attack_timer = min(ATTACK_COOLDOWN, self.attack_timer + game_framework.frame_time)
+        self.attack_timer = min(ATTACK_COOLDOWN, self.attack_timer + self.world.dt)
 
         super().update()
 
     def _update_idle(self, zag):
-        dt = game_framework.frame_time
+        dt = self.world.dt
         self.anim_timer += dt
         if self.anim_timer >= IDLE_ANIM_SPEED:
             self.anim_timer -= IDLE_ANIM_SPEED
@@ -237,7 +260,7 @@ class GoblinKing(GameObject):
                 if self.perception.is_in_range(BOMB_ATTACK_RANGE):
                     self._start_bomb_attack(zag)
                 else:
-                    if random.random() < 0.5:
+                    if self.world.rng.ai.random() < 0.5:
                         self._start_gun_attack(zag)
                     else:
                         self._start_bomb_attack(zag)
@@ -255,7 +278,7 @@ class GoblinKing(GameObject):
         self.movement.ydir = 0
 
     def _update_bomb_attack(self, zag):
-        dt = game_framework.frame_time
+        dt = self.world.dt
         self.anim_timer += dt
         if self.anim_timer >= BOMB_ANIM_SPEED:
             self.anim_timer -= BOMB_ANIM_SPEED
@@ -269,7 +292,8 @@ class GoblinKing(GameObject):
         if self.frame == BOMB_FRAME_COUNT - 1 and not self.attack_fired:
             self.attack_fired = True
             target_ref = zag if zag else (self.x + self.dir * 120, self.y)
-            bomb = BombProjectile(
+            bomb = self.world.pools.acquire(
+                BombProjectile,
                 self.x,
                 self.y,
                 target_ref,
@@ -278,7 +302,7 @@ class GoblinKing(GameObject):
                 damage=BOMB_DAMAGE,
                 gravity=BOMB_FLIGHT_GRAVITY,
             )
-            game_world.add_object(bomb)
+            self.world.add_object(bomb)
 
     def _start_gun_attack(self, zag):
         self.state = "gun_attack"
@@ -293,7 +317,7 @@ class GoblinKing(GameObject):
         self.movement.ydir = 0
 
     def _update_gun_attack(self, zag):
-        dt = game_framework.frame_time
+        dt = self.world.dt
         self.anim_timer += dt
         if self.anim_timer >= GUN_ANIM_SPEED:
             self.anim_timer -= GUN_ANIM_SPEED
@@ -310,14 +334,15 @@ class GoblinKing(GameObject):
                 direction = (zag.x - self.x, zag.y - self.y)
             else:
                 direction = (-1, 0) if self.dir < 0 else (1, 0)
-            missile = MissileProjectile(
+            missile = self.world.pools.acquire(
+                MissileProjectile,
                 self.x + self.dir * 30,
                 self.y + 10,
                 direction,
                 self.missile_image,
                 damage=MISSILE_DAMAGE,
             )
-            game_world.add_object(missile)
+            self.world.add_object(missile)
 
     def _can_backrun(self):
         # Allow the backrun unless the boss is already too high, where another jump
@@ -329,12 +354,12 @@ class GoblinKing(GameObject):
         self._set_animation(self.back_image, BACKRUN_FRAME_W, BACKRUN_FRAME_H)
         self.backrun_timer = 0.0
         self.vertical_velocity = BACKRUN_JUMP_VY
-        canvas_mid_x = get_canvas_width() * 0.5
-        self.movement.xdir = 1 if self.transform.x < canvas_mid_x else -1
+        mid_x = self.world.bounds.width * 0.5
+        self.movement.xdir = 1 if self.transform.x < mid_x else -1
         self.movement.speed = BACKRUN_SPEED
 
     def _update_backrun(self, zag):
-        dt = game_framework.frame_time
+        dt = self.world.dt
         self.backrun_timer += dt
         self.anim_timer += dt
         if self.anim_timer >= GUN_ANIM_SPEED:
@@ -368,10 +393,12 @@ class GoblinKing(GameObject):
         elif self.state == "hit":
             self._set_animation(self.hit_image, IDLE_FRAME_W, IDLE_FRAME_H)
 
-    def handle_collision(self, other):
+    def on_collision_enter(self, other):
         if getattr(other, "collision_group", None) == CollisionGroup.PROJECTILE:
             self._enter_hit(other)
-        elif getattr(other, "collision_group", None) == CollisionGroup.PLAYER:
+
+    def handle_collision(self, other):
+        if getattr(other, "collision_group", None) == CollisionGroup.PLAYER:
             combat = getattr(other, "combat", None)
             if combat:
                 combat.take_damage(12)
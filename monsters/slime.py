@@ -1,14 +1,13 @@
 import os
-import random
 
 from pico2d import *
 
 from common import resource_path
-import game_framework
-import game_world
+import asset_loader
 
 from behavior_tree import Action, BehaviorTree, Condition, Selector, Sequence
 from collision_manager import CollisionGroup
+from components.component_ai_lod import AILodComponent
 from components.component_combat import CombatComponent
 from components.component_collision import CollisionComponent
 from components.component_hud import HUDComponent
@@ -44,22 +43,31 @@ ATTACK_ANIM_SPEED = 0.2          # 공격 준비 애니메이션 속도 (프레
 ATTACK_HOLD_DURATION = 0.5       # 공격 전 1초 대기 시간
 ATTACK_DASH_DURATION = 0.2       # 실제 돌진(dash)에 걸리는 시간
 
+IMAGE_PATH = resource_path('resource/Image/Monster/Blue_Slime.png')
+
+# AI LOD 거리(px): NEAR 안은 매 스텝, FAR 밖은 정지
+AI_LOD_NEAR = 700
+AI_LOD_FAR = 1300
+
 
 class Slime(GameObject):
+    ASSETS = [IMAGE_PATH, *HUDComponent.ASSETS]
+
     def __init__(self):
         super().__init__()
 
-        image_path = resource_path('resource/Image/Monster/Blue_Slime.png')
+        image_path = IMAGE_PATH
         if not os.path.exists(image_path):
             raise FileNotFoundError(f"Image not found: `{image_path}`")
 
-        start_x = random.randint(120, max(130, get_canvas_width() - 120))
+        spawn = self.world.bounds.spawn
+        start_x = self.world.rng.spawn.randint(120, max(130, spawn.right - 120))
         start_y_lower = 120
-        start_y_upper = max(start_y_lower + 1, get_canvas_height() - start_y_lower)
-        start_y = random.randint(start_y_lower, start_y_upper)
+        start_y_upper = max(start_y_lower + 1, spawn.top - start_y_lower)
+        start_y = self.world.rng.spawn.randint(start_y_lower, start_y_upper)
 
         self.transform = self.add_component(TransformComponent(start_x, start_y, FRAME_W * SCALE, FRAME_H * SCALE))
-        self.sprite = self.add_component(SpriteComponent(load_image(image_path), FRAME_W, FRAME_H))
+        self.sprite = self.add_component(SpriteComponent(asset_loader.load_image(image_path), FRAME_W, FRAME_H))
         self.collision_group = CollisionGroup.MONSTER
         self.collision = self.add_component(
             CollisionComponent(
@@ -72,11 +80,12 @@ class Slime(GameObject):
         self.combat = self.add_component(CombatComponent(10))
         self.movement = self.add_component(MovementComponent())
         self.perception = self.add_component(PerceptionComponent())
+        self.ai_lod = self.add_component(AILodComponent(AI_LOD_NEAR, AI_LOD_FAR))
         self.hud = self.add_component(HUDComponent())
 
         self.y_base = self.transform.y
 
-        self.jump_timer = random.uniform(0.0, HOP_INTERVAL)
+        self.jump_timer = self.world.rng.ai.uniform(0.0, HOP_INTERVAL)
         self.frame = JUMP_LAND_FRAME
         self.anim_timer = 0.0
 
@@ -163,7 +172,7 @@ class Slime(GameObject):
 
         if self.hp <= 0 and not self.dead:
             self.dead = True
-            game_world.remove_object(self)
+            self.world.remove_object(self)
             return
 
         self.perception.target = zag
@@ -206,7 +215,7 @@ class Slime(GameObject):
         return BehaviorTree.RUNNING
 
     def run_attack(self):
-        dt = game_framework.frame_time
+        dt = self.world.dt
 
         if (self.attack_state != 'dash' or not self.attack_dash_started) and (
             self.perception.distance_sq_to_target() > ATTACK_MAX_RANGE * ATTACK_MAX_RANGE
@@ -259,7 +268,7 @@ class Slime(GameObject):
         self.attack_dash_started = False
 
     def handle_hop(self):
-        dt = game_framework.frame_time
+        dt = self.world.dt
 
         if self.attack_state == 'none':
             self.attack_cooltime_timer += dt
@@ -302,10 +311,13 @@ class Slime(GameObject):
     def draw(self):
         super().draw()
 
-    def handle_collision(self, other):
+    def on_collision_enter(self, other):
         if getattr(other, "collision_group", None) == CollisionGroup.PROJECTILE:
             self._enter_hit(other)
-        elif getattr(other, "collision_group", None) == CollisionGroup.PLAYER:
+
+    def handle_collision(self, other):
+        # 닿아 있는 동안 매 프레임 피해 (간격은 플레이어 무적 시간이 만든다)
+        if getattr(other, "collision_group", None) == CollisionGroup.PLAYER:
             combat = getattr(other, "combat", None)
             if combat:
                 combat.take_damage(10)
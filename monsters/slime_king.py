@@ -1,13 +1,10 @@
 import os
-import random
-
-from pico2d import get_canvas_height, get_canvas_width, load_image
 
 from common import resource_path
-import game_framework
-import game_world
+import asset_loader
 from behavior_tree import Action, BehaviorTree, Condition, Selector, Sequence
 from collision_manager import CollisionGroup
+from components.component_ai_lod import AILodComponent
 from components.component_combat import CombatComponent
 from components.component_collision import CollisionComponent
 from components.component_hud import HUDComponent
@@ -51,27 +48,38 @@ GRAVITY = -950.0
 FALL_ANIM_SPEED = 0.08
 LANDING_DAMAGE = 60
 
+IDLE_PATH = resource_path("resource/Image/Monster/SlimeKing Idle.png")
+ATTACK_PATH = resource_path("resource/Image/Monster/SlimeKing Att.png")
+BACK_PATH = resource_path("resource/Image/Monster/SlimeKing Back.png")
+
+# 보스는 스테이지 어디에 있든 거의 항상 매 스텝 update 되도록 넓게 잡는다
+AI_LOD_NEAR = 1200
+AI_LOD_FAR = 2400
+
 
 class SlimeKing(GameObject):
+    ASSETS = [IDLE_PATH, ATTACK_PATH, BACK_PATH, *HUDComponent.ASSETS]
+
     def __init__(self):
         super().__init__()
 
-        idle_path = resource_path("resource/Image/Monster/SlimeKing Idle.png")
-        attack_path = resource_path("resource/Image/Monster/SlimeKing Att.png")
-        back_path = resource_path("resource/Image/Monster/SlimeKing Back.png")
+        idle_path = IDLE_PATH
+        attack_path = ATTACK_PATH
+        back_path = BACK_PATH
 
         if not (os.path.exists(idle_path) and os.path.exists(attack_path) and os.path.exists(back_path)):
             raise FileNotFoundError("SlimeKing sprite resources are missing")
 
-        start_x = random.randint(150, max(160, get_canvas_width() - 150))
+        bounds = self.world.bounds
+        start_x = self.world.rng.spawn.randint(150, max(160, bounds.spawn.right - 150))
         # 플레이어가 위로 올라가야 하는 보스 위치를 강조하기 위해 시작 y 값을 높임
-        start_y = random.randint(int(get_canvas_height() * 1.3), get_canvas_height() * 2 - 220)
+        start_y = self.world.rng.spawn.randint(int(bounds.height * 0.65), bounds.height - 220)
 
         self.transform = self.add_component(TransformComponent(start_x, start_y, FRAME_W * SCALE, FRAME_H * SCALE))
-        self.sprite = self.add_component(SpriteComponent(load_image(idle_path), FRAME_W, FRAME_H))
+        self.sprite = self.add_component(SpriteComponent(asset_loader.load_image(idle_path), FRAME_W, FRAME_H))
         self.idle_image = self.sprite.image
-        self.attack_image = load_image(attack_path)
-        self.back_image = load_image(back_path)
+        self.attack_image = asset_loader.load_image(attack_path)
+        self.back_image = asset_loader.load_image(back_path)
 
         self.collision_group = CollisionGroup.MONSTER
         collision_w = self.transform.w * COLLISION_SCALE
@@ -88,6 +96,7 @@ class SlimeKing(GameObject):
         self.combat = self.add_component(CombatComponent(50))
         self.movement = self.add_component(MovementComponent(70))
         self.perception = self.add_component(PerceptionComponent())
+        self.ai_lod = self.add_component(AILodComponent(AI_LOD_NEAR, AI_LOD_FAR))
         # HP 바를 보스에 맞게 키우고 조금 더 위로 배치
         self.hud = self.add_component(HUDComponent(hp_width=80, hp_height=8, hp_offset=80))
 
@@ -102,7 +111,7 @@ class SlimeKing(GameObject):
         self.frame_index = 0
         self.frame_count = len(self.frame_indices)
 
-        self.jump_timer = random.uniform(0.0, HOP_INTERVAL)
+        self.jump_timer = self.world.rng.ai.uniform(0.0, HOP_INTERVAL)
         self.preparing = False
         self.hopping = False
 
@@ -184,11 +193,11 @@ class SlimeKing(GameObject):
 
     def update(self, zag=None):
         if self.hp <= 0:
-            game_world.remove_object(self)
+            self.world.remove_object(self)
             return
 
         if self.landing_attack_timer > 0:
-            self.landing_attack_timer -= game_framework.frame_time
+            self.landing_attack_timer -= self.world.dt
 
         self.perception.target = zag
         self.bt.run()
@@ -202,7 +211,7 @@ class SlimeKing(GameObject):
             self.frame = self.frame_indices[self.frame_index]
 
     def handle_hop(self):
-        dt = game_framework.frame_time
+        dt = self.world.dt
 
         if self.attack_state == "none" and self.jump_attack_state == "none":
             self.attack_cooltime_timer = min(ATTACK_COOLTIME, self.attack_cooltime_timer + dt)
@@ -283,7 +292,7 @@ class SlimeKing(GameObject):
         return BehaviorTree.RUNNING
 
     def run_attack(self):
-        dt = game_framework.frame_time
+        dt = self.world.dt
 
         if self.attack_state == "prepare":
             self.attack_anim_timer += dt
@@ -353,7 +362,7 @@ class SlimeKing(GameObject):
         if self.hp <= self.combat.max_hp * 0.5:
             prob = JUMP_ATTACK_PROB_ENRAGE
 
-        if random.random() <= prob:
+        if self.world.rng.ai.random() <= prob:
             return BehaviorTree.SUCCESS
         return BehaviorTree.FAIL
 
@@ -383,7 +392,7 @@ class SlimeKing(GameObject):
         return BehaviorTree.RUNNING
 
     def run_jump_attack(self):
-        dt = game_framework.frame_time
+        dt = self.world.dt
 
         if self.jump_attack_state == "prepare":
             target = self.perception.target
@@ -472,10 +481,13 @@ class SlimeKing(GameObject):
 
         return BehaviorTree.RUNNING
 
-    def handle_collision(self, other):
+    def on_collision_enter(self, other):
         if getattr(other, "collision_group", None) == CollisionGroup.PROJECTILE:
             self._enter_hit(other)
-        elif getattr(other, "collision_group", None) == CollisionGroup.PLAYER:
+
+    def handle_collision(self, other):
+        # 플레이어가 닿아 있는 동안 공격을 시작할 수 있으므로 근접 공격 판정은 매 프레임 한다.
+        if getattr(other, "collision_group", None) == CollisionGroup.PLAYER:
             # 플레이어 근접 공격으로 명중했을 때 SlimeKing도 피해를 입도록 처리
             attack_comp = other.get(AttackComponent) if hasattr(other, "get") else None
             if attack_comp and attack_comp.is_attacking() and self not in attack_comp.hit_monsters:
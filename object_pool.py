@@ -0,0 +1,53 @@
+# 객체 풀
+# 자주 만들고 버리는 투사체/이펙트를 타입별로 모아 두었다가 reset() 으로 초기화해 다시 쓴다.
+# 풀에 넣는 클래스는 생성자와 같은 인자를 받는 reset() 을 구현해야 한다.
+# 월드에서 제거된 객체는 World 가 자동으로 풀에 돌려준다.
+MAX_POOL_SIZE = 256
+
+
+class ObjectPool:
+    def __init__(self, cls, max_size=MAX_POOL_SIZE):
+        self.cls = cls
+        self.max_size = max_size
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj.active = True
+            obj.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            obj.pool = self
+            self.misses += 1
+        return obj
+
+    def release(self, obj):
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+
+
+class PoolRegistry:
+    def __init__(self):
+        self.pools = {}
+
+    def acquire(self, cls, *args, **kwargs):
+        pool = self.pools.get(cls)
+        if pool is None:
+            pool = ObjectPool(cls)
+            self.pools[cls] = pool
+        return pool.acquire(*args, **kwargs)
+
+    def clear(self):
+        for pool in self.pools.values():
+            pool.free.clear()
+
+    def stats(self):
+        # {클래스 이름: {"hits", "misses", "free"}}
+        return {
+            cls.__name__: {"hits": pool.hits, "misses": pool.misses, "free": len(pool.free)}
+            for cls, pool in self.pools.items()
+        }
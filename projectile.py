@@ -1,9 +1,5 @@
 import math
 
-from pico2d import get_canvas_height, get_canvas_width
-
-import game_framework
-import game_world
 from collision_manager import CollisionGroup
 from components.component_collision import CollisionComponent
 from components.component_combat import CombatComponent
@@ -15,9 +11,13 @@ from game_object import GameObject
 
 
 DEFAULT_KNOCKBACK_Y = 300
+BOMB_WIDTH, BOMB_HEIGHT = 40, 44
 
 
 class Projectile(GameObject):
+    # 한 스텝에 자기 크기만큼 움직일 수 있는 빠른 투사체는 True (스윕 충돌 검사)
+    continuous_collision = False
+
     def __init__(
         self,
         x,
@@ -34,25 +34,60 @@ class Projectile(GameObject):
     ):
         super().__init__()
         self.collision_group = CollisionGroup.PROJECTILE
-        self.damage = damage
-        self.knockback_x = knockback_x
-        self.knockback_y = knockback_y
 
         self.transform = self.add_component(TransformComponent(x, y, width, height))
         self.movement = self.add_component(MovementComponent(speed))
-        self.movement.type = None
+        # 투사체는 화면 경계에 막히지 않고 날아가다가 밖으로 나가면 제거된다.
+        self.movement.clamp_to_bounds = False
         self.collision = self.add_component(
             CollisionComponent(
                 group=CollisionGroup.PROJECTILE,
                 mask=collision_mask,
                 width=width,
                 height=height,
+                continuous=self.continuous_collision,
             )
         )
-        self.render = None
+        # 풀에서 재사용될 때 이미지가 생길 수 있으므로 렌더 컴포넌트는 항상 둔다 (이미지가 없으면 그리지 않음).
+        self.render = self.add_component(RenderComponent(image, width, height))
+
+        self.launch(x, y, direction, speed, damage, width, height, image, knockback_x, knockback_y, collision_mask)
+
+    def launch(
+        self,
+        x,
+        y,
+        direction,
+        speed,
+        damage,
+        width,
+        height,
+        image=None,
+        knockback_x=140,
+        knockback_y=DEFAULT_KNOCKBACK_Y,
+        collision_mask=CollisionGroup.MONSTER,
+    ):
+        # 컴포넌트는 그대로 두고 발사 상태만 초기화한다. 풀에서 꺼낸 투사체는 reset() 에서 이것을 호출한다.
+        self.damage = damage
+        self.knockback_x = knockback_x
+        self.knockback_y = knockback_y
 
-        if image:
-            self.render = self.add_component(RenderComponent(image, width, height))
+        tr = self.transform
+        tr.x, tr.y, tr.w, tr.h = x, y, width, height
+        tr.prev_x, tr.prev_y = x, y
+
+        self.movement._reset_path()
+        self.movement.type = MovementType.DIRECTIONAL
+        self.movement.speed = speed
+
+        self.collision.mask = collision_mask
+        self.collision.override_width = width
+        self.collision.override_height = height
+
+        self.render.image = image
+        self.render.draw_width = width
+        self.render.draw_height = height
+        self.render.flip = ""
 
         self.set_direction(direction)
 
@@ -65,9 +100,7 @@ class Projectile(GameObject):
 
         self.movement.xdir = math.cos(angle)
         self.movement.ydir = math.sin(angle)
-
-        if self.render:
-            self.render.rotation = angle
+        self.render.rotation = angle
 
     def _apply_knockback(self, other):
         other_transform = getattr(other, "transform", None)
@@ -79,7 +112,8 @@ class Projectile(GameObject):
         if other_move:
             other_move.ydir -= 10
 
-    def handle_collision(self, other):
+    def on_collision_enter(self, other):
+        # 처음 닿은 순간에 피해를 주고 사라지므로 겹쳐 있는 동안 반복 호출될 필요가 없다.
         if getattr(other, "collision_group", None) == CollisionGroup.PROJECTILE:
             return
 
@@ -90,50 +124,53 @@ class Projectile(GameObject):
             other.take_damage(self.damage)
 
         self._apply_knockback(other)
-        game_world.remove_object(self)
+        self.world.remove_object(self)
 
     def update(self):
-        dt = game_framework.frame_time
-        if self.movement:
-            self.transform.x += self.movement.xdir * self.movement.speed * dt
-            self.transform.y += self.movement.ydir * self.movement.speed * dt
-
         super().update()
 
         if self.movement and self.movement.type == MovementType.DIRECTIONAL:
-            cw = get_canvas_width()
-            world_height = get_canvas_height() * 2
+            area = self.world.bounds.despawn
             if (
-                self.transform.x < -self.transform.w
-                or self.transform.x > cw + self.transform.w
-                or self.transform.y < -self.transform.h
-                or self.transform.y > world_height + self.transform.h
+                self.transform.x < area.left - self.transform.w
+                or self.transform.x > area.right + self.transform.w
+                or self.transform.y < area.bottom - self.transform.h
+                or self.transform.y > area.top + self.transform.h
             ):
-                game_world.remove_object(self)
+                self.world.remove_object(self)
 
 
 class ExplosionEffect(GameObject):
     def __init__(self, x, y, images, interval=0.05):
         super().__init__()
+        self.transform = self.add_component(TransformComponent(x, y))
+        self.sprite = self.add_component(SpriteComponent(images[0], images[0].w, images[0].h))
+        self.reset(x, y, images, interval)
+
+    def reset(self, x, y, images, interval=0.05):
         self.images = images
         self.interval = interval
         self.timer = 0.0
         self.index = 0
 
-        max_w = max(img.w for img in images)
-        max_h = max(img.h for img in images)
+        tr = self.transform
+        tr.x, tr.y = x, y
+        tr.prev_x, tr.prev_y = x, y
+        tr.w = max(img.w for img in images)
+        tr.h = max(img.h for img in images)
 
-        self.transform = self.add_component(TransformComponent(x, y, max_w, max_h))
-        self.sprite = self.add_component(SpriteComponent(images[0], images[0].w, images[0].h))
+        self.sprite.image = images[0]
+        self.sprite.frame_w = images[0].w
+        self.sprite.frame_h = images[0].h
 
     def update(self, target=None):
-        dt = game_framework.frame_time
+        dt = self.world.dt
         self.timer += dt
         if self.timer >= self.interval:
             self.timer -= self.interval
             self.index += 1
             if self.index >= len(self.images):
-                game_world.remove_object(self)
+                self.world.remove_object(self)
                 return
             self.sprite.image = self.images[self.index]
             self.sprite.frame_w = self.sprite.image.w
@@ -157,6 +194,49 @@ class BombProjectile(Projectile):
         lifetime=3.0,
         detonate_distance=40.0,
     ):
+        super().__init__(
+            x,
+            y,
+            (1, 0),
+            speed=0,
+            damage=damage,
+            width=BOMB_WIDTH,
+            height=BOMB_HEIGHT,
+            image=image,
+            knockback_x=280,
+            knockback_y=600,
+            collision_mask=CollisionGroup.PLAYER,
+        )
+        self._prepare_flight(x, y, target, explosion_images, gravity, lifetime, detonate_distance)
+
+    def reset(
+        self,
+        x,
+        y,
+        target,
+        image,
+        explosion_images,
+        damage,
+        gravity=-1200.0,
+        lifetime=3.0,
+        detonate_distance=40.0,
+    ):
+        self.launch(
+            x,
+            y,
+            (1, 0),
+            speed=0,
+            damage=damage,
+            width=BOMB_WIDTH,
+            height=BOMB_HEIGHT,
+            image=image,
+            knockback_x=280,
+            knockback_y=600,
+            collision_mask=CollisionGroup.PLAYER,
+        )
+        self._prepare_flight(x, y, target, explosion_images, gravity, lifetime, detonate_distance)
+
+    def _prepare_flight(self, x, y, target, explosion_images, gravity, lifetime, detonate_distance):
         target_pos = (target.transform.x, target.transform.y) if hasattr(target, "transform") else target
         dx = target_pos[0] - x
         dy = target_pos[1] - y
@@ -177,25 +257,8 @@ class BombProjectile(Projectile):
         self.explosion_height = max((img.h for img in explosion_images), default=44)
 
         self.flight_time = max(0.5, min(1.2, abs(dx) / 200.0 + 0.6))
-        vx = dx / self.flight_time
-        vy = dy / self.flight_time - 0.5 * gravity * self.flight_time
-
-        width, height = 40, 44
-        super().__init__(
-            x,
-            y,
-            (1, 0),
-            speed=0,
-            damage=damage,
-            width=width,
-            height=height,
-            image=image,
-            knockback_x=280,
-            knockback_y=600,
-            collision_mask=CollisionGroup.PLAYER,
-        )
-        self.vx = vx
-        self.vy = vy
+        self.vx = dx / self.flight_time
+        self.vy = dy / self.flight_time - 0.5 * gravity * self.flight_time
         self.movement.xdir = 1 if self.vx >= 0 else -1
 
     def _apply_explosion_damage(self, target=None):
@@ -229,15 +292,16 @@ class BombProjectile(Projectile):
         self.movement.xdir = 0
         self.movement.ydir = 0
 
-        game_world.add_object(ExplosionEffect(self.transform.x, self.transform.y, self.explosion_images), depth=1)
+        explosion = self.world.pools.acquire(ExplosionEffect, self.transform.x, self.transform.y, self.explosion_images)
+        self.world.add_object(explosion, depth=1)
         self._apply_explosion_damage(target)
 
     def update(self, target=None):
-        dt = game_framework.frame_time
+        dt = self.world.dt
         if self.exploded:
             self.explosion_timer += dt
             if self.explosion_timer >= self.explosion_duration:
-                game_world.remove_object(self)
+                self.world.remove_object(self)
                 return
 
             super().update()
@@ -251,16 +315,14 @@ class BombProjectile(Projectile):
         self.transform.x += self.vx * dt
         self.transform.y += self.vy * dt
 
-        cw = get_canvas_width()
-        ch = get_canvas_height()
-        world_h = ch * 2
+        area = self.world.bounds.despawn
         if (
-            self.transform.x < -self.transform.w
-            or self.transform.x > cw + self.transform.w
-            or self.transform.y < -self.transform.h
-            or self.transform.y > world_h + self.transform.h
+            self.transform.x < area.left - self.transform.w
+            or self.transform.x > area.right + self.transform.w
+            or self.transform.y < area.bottom - self.transform.h
+            or self.transform.y > area.top + self.transform.h
         ):
-            game_world.remove_object(self)
+            self.world.remove_object(self)
             return
 
         dx = self.target_pos[0] - self.transform.x
@@ -281,7 +343,8 @@ class BombProjectile(Projectile):
 
         super().update()
 
-    def handle_collision(self, other):
+    def on_collision_enter(self, other):
+        # 폭발 범위에 새로 들어온 대상만 피해를 받는다 (이미 닿아 있던 대상은 damaged_targets 로도 걸러짐).
         if getattr(other, "collision_group", None) == CollisionGroup.PLAYER:
             if self.exploded:
                 self._apply_explosion_damage(other)
@@ -290,6 +353,8 @@ class BombProjectile(Projectile):
 
 
 class MissileProjectile(Projectile):
+    continuous_collision = True
+
     def __init__(self, x, y, direction, image, damage):
         super().__init__(
             x,
@@ -305,9 +370,24 @@ class MissileProjectile(Projectile):
             collision_mask=CollisionGroup.PLAYER,
         )
 
-    def handle_collision(self, other):
+    def reset(self, x, y, direction, image, damage):
+        self.launch(
+            x,
+            y,
+            direction,
+            speed=420.0,
+            damage=damage,
+            width=18,
+            height=18,
+            image=image,
+            knockback_x=90,
+            knockback_y=150,
+            collision_mask=CollisionGroup.PLAYER,
+        )
+
+    def on_collision_enter(self, other):
         self.knockback_y = 150
-        super().handle_collision(other)
+        super().on_collision_enter(other)
 
     def update(self):
         super().update()
@@ -0,0 +1,86 @@
+# 입력 녹화/재생
+# play_mode 가 Zag 에게 넘기는 SDL 이벤트를 월드 틱 번호와 함께 작은 바이너리 파일로 저장한다.
+# 같은 시드/스테이지/고정 스텝으로 다시 돌리면서 같은 틱에 같은 이벤트를 넣으면 플레이가 그대로 재현된다.
+# 틱은 play_mode.input_tick 이라 F9 로 스테이지를 되돌려도 줄어들지 않는다.
+#
+# 파일 형식 (리틀 엔디언)
+#   헤더: magic(4s) version(H) seed(q) stage(H) dt(d)
+#   레코드: tick(I) type(I) key(i)   (key 가 없으면 -1)
+import struct
+
+from pico2d import Event
+
+MAGIC = b"ZRPL"
+VERSION = 2
+HEADER = struct.Struct("<4sHqHd")
+RECORD = struct.Struct("<IIi")
+NO_KEY = -1
+
+
+class ReplayError(Exception):
+    pass
+
+
+class ReplayRecorder:
+    def __init__(self, path, seed, stage, dt):
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, stage, dt or 0.0))
+        self.count = 0
+
+    def record(self, tick, event):
+        key = event.key if event.key is not None else NO_KEY
+        self.file.write(RECORD.pack(tick, event.type, key))
+        self.count += 1
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class ReplayPlayer:
+    # 녹화된 이벤트를 틱 순서대로 꺼내 준다.
+    def __init__(self, records):
+        self.records = records
+        self.index = 0
+
+    def poll(self, tick):
+        # tick 이전(포함)에 녹화된 이벤트를 반환한다.
+        events = []
+        while self.index < len(self.records) and self.records[self.index][0] <= tick:
+            _, event_type, key = self.records[self.index]
+            event = Event(event_type)
+            event.key = key if key != NO_KEY else None
+            events.append(event)
+            self.index += 1
+        return events
+
+    @property
+    def finished(self):
+        return self.index >= len(self.records)
+
+    @property
+    def last_tick(self):
+        return self.records[-1][0] if self.records else 0
+
+
+def load(path):
+    # (header dict, [(tick, type, key), ...]) 반환
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if len(data) < HEADER.size:
+        raise ReplayError(f"{path}: 리플레이 헤더가 없습니다.")
+    magic, version, seed, stage, dt = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ReplayError(f"{path}: 리플레이 파일이 아닙니다.")
+    if version != VERSION:
+        raise ReplayError(f"{path}: 지원하지 않는 리플레이 버전 {version}")
+
+    body = memoryview(data)[HEADER.size:]
+    # 녹화 중 강제 종료되어 잘린 마지막 레코드는 무시한다.
+    usable = len(body) - len(body) % RECORD.size
+    records = list(RECORD.iter_unpack(body[:usable]))
+    header = {"seed": seed, "stage": stage, "dt": dt}
+    return header, records
@@ -0,0 +1,59 @@
+# 녹화된 리플레이를 SDL 창 없이 최대 속도로 재생한다 (부하 테스트/프레임 프로파일링용)
+# 사용법: python replay_runner.py session.rpl --profile frames.csv
+import argparse
+import time
+
+import headless
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리플레이 파일을 헤드리스로 최대 속도 재생합니다.")
+    parser.add_argument("replay", help="main.py --record 로 만든 리플레이 파일")
+    parser.add_argument("--tail", type=float, default=5.0, help="마지막 입력 이후 더 진행할 시간(초)")
+    parser.add_argument("--profile", metavar="CSV", help="틱별 단계 시간을 CSV 로 저장")
+    args = parser.parse_args()
+
+    headless.install()
+
+    import frame_profiler
+    import game_framework
+    import replay
+    from behavior_tree import BehaviorTree
+    from modes import play_mode
+
+    header, records = replay.load(args.replay)
+    dt = header["dt"]
+    if dt <= 0:
+        raise SystemExit("고정 스텝 없이 녹화된 리플레이는 재현할 수 없습니다 (--tick-rate 0).")
+    rate = round(1.0 / dt)
+
+    BehaviorTree.verbose = False
+    game_framework.set_fixed_step(rate)
+    game_framework.set_synthetic_frame_time(dt)
+    play_mode.prepare_stage(header["stage"])
+    play_mode.set_seed(header["seed"])
+    play_mode.play_replay(records)
+
+    player = play_mode.replay_player
+    max_ticks = player.last_tick + int(args.tail * rate)
+    if args.profile:
+        # 프레임 번호가 틱과 맞도록 재생 전체를 한 번에 보관한다.
+        frame_profiler.enable(history_size=max_ticks + 2, dump_path=args.profile)
+
+    def finished():
+        return play_mode.result_state is not None or play_mode.input_tick >= max_ticks
+
+    wall_start = time.perf_counter()
+    game_framework.run(play_mode, until=finished)
+    wall_time = time.perf_counter() - wall_start
+
+    ticks = play_mode.input_tick
+    sim_time = ticks / rate
+    print(f"stage={header['stage']} seed={header['seed']} events={len(records)} "
+          f"result={play_mode.result_state or 'timeout'} ticks={ticks} "
+          f"sim_time={sim_time:.2f}s wall_time={wall_time:.2f}s "
+          f"speedup=x{sim_time / wall_time if wall_time > 0 else 0:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# 월드별 난수 서비스
+# 하나의 시드에서 용도별(spawn/ai/fx) 독립 스트림을 만든다.
+# 스트림이 분리되어 있으므로 이펙트 난수를 더 뽑아도 스폰 위치나 AI 선택은 바뀌지 않는다.
+import random
+import zlib
+
+STREAM_NAMES = ("spawn", "ai", "fx")
+
+
+class RandomStreams:
+    def __init__(self, seed=None):
+        # seed 가 None 이면 실행마다 다른 시드를 뽑는다 (기존 동작과 동일).
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self._streams = {}
+        for name in STREAM_NAMES:
+            self.stream(name)
+
+    def stream(self, name):
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = random.Random(_derive_seed(self.seed, name))
+            self._streams[name] = stream
+        return stream
+
+    @property
+    def spawn(self):
+        return self._streams["spawn"]
+
+    @property
+    def ai(self):
+        return self._streams["ai"]
+
+    @property
+    def fx(self):
+        return self._streams["fx"]
+
+
+def _derive_seed(seed, name):
+    # 같은 (seed, name) 이면 어떤 프로세스/파이썬 실행에서도 같은 값 (hash() 는 실행마다 달라서 쓰지 않는다)
+    return zlib.crc32(f"{seed}:{name}".encode("utf-8"))
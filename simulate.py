@@ -0,0 +1,91 @@
+# 헤드리스 스테이지 시뮬레이션 (밸런스/회귀 확인용)
+# 사용법: python simulate.py --stage 1 --seconds 600 --rate 120 --seed 42
+import argparse
+import time
+
+import headless
+
+
+def run_stage(stage, seconds=600.0, rate=120, seed=None, soa=False, snapshot_path=None, broadphase=None):
+    # 스테이지 하나를 끝까지(또는 seconds 만큼) 돌리고 결과를 dict 로 돌려준다.
+    # 게임 모듈은 headless.install() 이후에 import 해야 가짜 pico2d 함수를 사용한다.
+    headless.install()
+
+    import collision_manager
+    import game_framework
+    import snapshot
+    from behavior_tree import BehaviorTree
+    from modes import play_mode
+
+    BehaviorTree.verbose = False
+    game_framework.set_fixed_step(rate)
+    game_framework.set_synthetic_frame_time(1.0 / rate)
+    play_mode.prepare_stage(stage)
+    play_mode.set_seed(seed)
+    play_mode.set_soa(soa)
+    if broadphase:
+        collision_manager.set_default_broadphase(broadphase)
+    if snapshot_path:
+        # 스냅샷 지점(예: 보스전)에서 바로 시작. stage 는 스냅샷에 저장된 값을 쓴다.
+        play_mode.start_from_snapshot(snapshot.load(snapshot_path))
+
+    max_frames = int(seconds * rate)
+    frames = 0
+    end_frame = None
+    end_hp = None
+
+    def finished():
+        nonlocal frames, end_frame, end_hp
+        frames += 1
+        if play_mode.result_state is not None and end_frame is None:
+            # 결과가 확정된 순간의 시간과 체력을 기록 (결과 화면 대기 시간은 제외)
+            end_frame = frames
+            end_hp = play_mode.zag.hp
+        return play_mode.result_state is not None or frames >= max_frames
+
+    wall_start = time.perf_counter()
+    game_framework.run(play_mode, until=finished)
+    wall_time = time.perf_counter() - wall_start
+
+    zag = play_mode.zag
+    if end_hp is None:
+        end_hp = zag.hp
+    # 마지막 타격으로 HP 가 음수가 될 수 있으므로 0 으로 자른다 (받은 피해가 최대 HP 를 넘지 않게).
+    end_hp = max(end_hp, 0)
+    sim_time = frames / rate
+    return {
+        "stage": play_mode.current_stage_data["id"],
+        "seed": play_mode.world.rng.seed,
+        "result": play_mode.result_state or "timeout",
+        "time_to_clear": end_frame / rate if play_mode.result_state == "victory" else None,
+        "damage_taken": zag.combat.max_hp - end_hp,
+        "sim_time": sim_time,
+        "wall_time": wall_time,
+        "pools": play_mode.world.pools.stats(),
+        "events": dict(play_mode.world.events.emitted),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SDL 창 없이 스테이지를 실제 시간보다 빠르게 시뮬레이션합니다.")
+    parser.add_argument("--stage", type=int, default=1)
+    parser.add_argument("--seconds", type=float, default=600.0, help="최대 시뮬레이션 시간(초)")
+    parser.add_argument("--rate", type=int, default=120, help="초당 update 횟수")
+    parser.add_argument("--seed", type=int, help="난수 시드 (생략 시 스테이지 정의 또는 임의 시드)")
+    parser.add_argument("--soa", action="store_true", help="NumPy 배열 기반 위치/이동 처리 사용")
+    parser.add_argument("--snapshot", metavar="PATH", help="스냅샷 지점에서 시작")
+    parser.add_argument("--broadphase", choices=["spatial_hash", "brute_force", "numpy"], help="충돌 브로드페이즈 (A/B 비교용)")
+    args = parser.parse_args()
+
+    result = run_stage(args.stage, args.seconds, args.rate, args.seed, args.soa, args.snapshot, args.broadphase)
+    wall_time = result["wall_time"]
+    sim_time = result["sim_time"]
+    print(f"stage={result['stage']} seed={result['seed']} result={result['result']} "
+          f"sim_time={sim_time:.2f}s wall_time={wall_time:.2f}s "
+          f"speedup=x{sim_time / wall_time if wall_time > 0 else 0:.1f}")
+    for name, stats in result["pools"].items():
+        print(f"pool {name}: hits={stats['hits']} misses={stats['misses']} free={stats['free']}")
+
+
+if __name__ == "__main__":
+    main()
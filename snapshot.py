@@ -0,0 +1,53 @@
+# 시뮬레이션 스냅샷
+# 객체 그래프 전체(World, 엔티티와 컴포넌트, BT/상태 머신, 타이머, 투사체, 카메라)를 pickle 로 직렬화하고 zlib 으로 압축한다.
+# 이미지/폰트는 텍스처를 담을 수 없으므로 asset_loader 의 키(경로)로만 저장하고, 복원할 때 캐시에서 다시 가져온다.
+import io
+import pickle
+import zlib
+
+import asset_loader
+
+MAGIC = b"ZSNP"
+VERSION = 1
+COMPRESS_LEVEL = 1  # 속도 우선
+
+
+class SnapshotError(Exception):
+    pass
+
+
+class AssetPickler(pickle.Pickler):
+    def persistent_id(self, obj):
+        # 리소스 객체는 내용 대신 키로 저장한다.
+        return asset_loader.asset_key(obj)
+
+
+class AssetUnpickler(pickle.Unpickler):
+    def persistent_load(self, key):
+        return asset_loader.load_by_key(key)
+
+
+def dumps(state):
+    buffer = io.BytesIO()
+    AssetPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(state)
+    return MAGIC + bytes([VERSION]) + zlib.compress(buffer.getvalue(), COMPRESS_LEVEL)
+
+
+def loads(blob):
+    if blob[:len(MAGIC)] != MAGIC:
+        raise SnapshotError("스냅샷 데이터가 아닙니다.")
+    version = blob[len(MAGIC)]
+    if version != VERSION:
+        raise SnapshotError(f"지원하지 않는 스냅샷 버전 {version}")
+    data = zlib.decompress(blob[len(MAGIC) + 1:])
+    return AssetUnpickler(io.BytesIO(data)).load()
+
+
+def save(path, blob):
+    with open(path, "wb") as f:
+        f.write(blob)
+
+
+def load(path):
+    with open(path, "rb") as f:
+        return f.read()
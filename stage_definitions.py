@@ -1,6 +1,9 @@
 from common import resource_path
 
 # 스테이지별 배경과 몬스터 스폰 정보
+# "seed" 를 넣으면 해당 스테이지의 스폰 위치와 AI 난수가 항상 같아진다 (생략 시 매번 다름).
+# "size": (width, height) 로 화면보다 큰 월드를 만들 수 있다 (생략 시 화면 너비 x 화면 높이 2배).
+#   이때 월드는 "chunk_size" (생략 시 화면 크기) 단위 청크로 나뉘어 카메라 주변 청크만 로드된다.
 STAGES = {
     1: {
         "id": 1,
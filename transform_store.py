@@ -0,0 +1,192 @@
+# NumPy 구조체 배열(SoA) 저장소 (선택 사항)
+# 월드에 추가된 엔티티의 위치/크기/이동 방향/속도를 엔티티 슬롯 번호로 색인된 연속 배열에 보관한다.
+# TransformComponent/MovementComponent 는 배열의 한 행을 읽고 쓰는 뷰로 바뀌고,
+# 방향 이동(DIRECTIONAL)은 integrate() 가 스텝마다 한 번의 벡터 연산으로 처리한다.
+# NumPy 가 없으면 AVAILABLE 이 False 이고 월드는 기존 객체 방식을 그대로 쓴다.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from components.component_move import MovementComponent, MovementType
+from components.component_transform import TransformComponent
+from entity_registry import INDEX_MASK
+
+AVAILABLE = np is not None
+
+TRANSFORM_FIELDS = ("x", "y", "w", "h", "prev_x", "prev_y")
+MOVEMENT_FIELDS = ("xdir", "ydir", "speed")
+# 바뀌면 행의 이동 모드(mode)를 다시 정해야 하는 속성
+MODE_FIELDS = ("type", "clamp_to_bounds")
+# 행마다 이번 스텝에 적분할 시간 (AI LOD 로 밀린 시간을 한 번에 받는 엔티티가 있으므로 행별로 둔다)
+STEP_FIELDS = ("dt",)
+
+MOVE_NONE = 0      # 벡터 이동 대상 아님 (경로 이동 중이거나 이동 컴포넌트 없음)
+MOVE_CLAMPED = 1   # 화면 경계로 클램핑되는 방향 이동
+MOVE_FREE = 2      # 경계 없는 방향 이동 (투사체)
+
+
+def _array_property(name):
+    def getter(self):
+        return getattr(self._store, name)[self._row]
+
+    def setter(self, value):
+        getattr(self._store, name)[self._row] = value
+
+    return property(getter, setter)
+
+
+def _mode_property(name):
+    attribute = "_" + name
+
+    def getter(self):
+        return getattr(self, attribute)
+
+    def setter(self, value):
+        setattr(self, attribute, value)
+        self._store.mode[self._row] = self._store.mode_for(self)
+
+    return property(getter, setter)
+
+
+class TransformView(TransformComponent):
+    # 저장소에 연결된 TransformComponent. attach() 가 기존 컴포넌트의 클래스를 이것으로 바꾼다.
+    x = _array_property("x")
+    y = _array_property("y")
+    w = _array_property("w")
+    h = _array_property("h")
+    prev_x = _array_property("prev_x")
+    prev_y = _array_property("prev_y")
+
+
+class MovementView(MovementComponent):
+    xdir = _array_property("xdir")
+    ydir = _array_property("ydir")
+    speed = _array_property("speed")
+    type = _mode_property("type")
+    clamp_to_bounds = _mode_property("clamp_to_bounds")
+
+    def update(self):
+        if self.type != MovementType.DIRECTIONAL:
+            super().update()
+            return
+        # 실제 이동은 integrate() 에서 한꺼번에 한다. 객체 방식과 같이 이번 스텝에 update 된 엔티티만 움직인다.
+        state_machine = getattr(self.owner, "state_machine", None)
+        self._store.armed[self._row] = not (state_machine and state_machine.is_attacking())
+        self._store.dt[self._row] = self.owner.world.dt
+
+
+class TransformStore:
+    def __init__(self, capacity=256):
+        self.capacity = 0
+        self.size = 0  # 사용 중인 가장 큰 행 번호 + 1
+        for name in TRANSFORM_FIELDS + MOVEMENT_FIELDS + STEP_FIELDS:
+            setattr(self, name, np.zeros(0, dtype=np.float64))
+        self.mode = np.zeros(0, dtype=np.int8)
+        self.armed = np.zeros(0, dtype=bool)
+        self._rows = {}  # row -> (transform, movement)
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        for name in TRANSFORM_FIELDS + MOVEMENT_FIELDS + STEP_FIELDS + ("mode", "armed"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def mode_for(self, movement):
+        if movement.type != MovementType.DIRECTIONAL:
+            return MOVE_NONE
+        return MOVE_CLAMPED if movement.clamp_to_bounds else MOVE_FREE
+
+    def attach(self, o, entity_id):
+        getter = getattr(o, "get", None)
+        if not callable(getter):
+            return
+        transform = getter(TransformComponent)
+        if transform is None:
+            return
+
+        row = entity_id & INDEX_MASK
+        if row >= self.capacity:
+            self._grow(max(row + 1, self.capacity * 2))
+        self.size = max(self.size, row + 1)
+
+        values = {name: transform.__dict__.pop(name) for name in TRANSFORM_FIELDS}
+        transform.__class__ = TransformView
+        transform._store, transform._row = self, row
+        for name, value in values.items():
+            setattr(transform, name, value)
+
+        movement = getter(MovementComponent)
+        if movement is not None:
+            values = {name: movement.__dict__.pop(name) for name in MOVEMENT_FIELDS}
+            modes = {name: movement.__dict__.pop(name) for name in MODE_FIELDS}
+            movement.__class__ = MovementView
+            movement._store, movement._row = self, row
+            for name, value in values.items():
+                setattr(movement, name, value)
+            for name, value in modes.items():
+                setattr(movement, "_" + name, value)
+            self.mode[row] = self.mode_for(movement)
+        self.armed[row] = False
+        self._rows[row] = (transform, movement)
+
+    def detach(self, entity_id):
+        # 월드에서 빠진 객체가 계속 쓰일 수 있으므로 값을 다시 일반 속성으로 돌려놓는다.
+        row = entity_id & INDEX_MASK
+        components = self._rows.pop(row, None)
+        if components is None:
+            return
+        transform, movement = components
+
+        values = {name: getattr(transform, name) for name in TRANSFORM_FIELDS}
+        transform.__class__ = TransformComponent
+        del transform._store, transform._row
+        for name, value in values.items():
+            setattr(transform, name, float(value))
+
+        if movement is not None:
+            values = {name: getattr(movement, name) for name in MOVEMENT_FIELDS}
+            modes = {name: movement.__dict__.pop("_" + name) for name in MODE_FIELDS}
+            movement.__class__ = MovementComponent
+            del movement._store, movement._row
+            for name, value in values.items():
+                setattr(movement, name, float(value))
+            movement.__dict__.update(modes)
+
+        self.mode[row] = MOVE_NONE
+        self.armed[row] = False
+        while self.size > 0 and (self.size - 1) not in self._rows:
+            self.size -= 1
+
+    def detach_all(self):
+        for row in list(self._rows):
+            self.detach(row)
+
+    def store_previous(self):
+        n = self.size
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def integrate(self, play):
+        # 이번 스텝에 update 된 방향 이동 엔티티를 각자의 dt 만큼 한 번에 이동시키고 필요하면 월드 경계로 클램핑한다.
+        n = self.size
+        if n == 0:
+            return
+        mode = self.mode[:n]
+        moving = self.armed[:n] & (mode != MOVE_NONE)
+        self.armed[:n] = False
+        if not moving.any():
+            return
+
+        x, y = self.x[:n], self.y[:n]
+        distance = self.speed[:n] * self.dt[:n]
+        np.add(x, self.xdir[:n] * distance, out=x, where=moving)
+        np.add(y, self.ydir[:n] * distance, out=y, where=moving)
+
+        clamped = moving & (mode == MOVE_CLAMPED)
+        if clamped.any():
+            x[clamped] = np.maximum(play.left, np.minimum(x[clamped], play.right))
+            y[clamped] = np.maximum(play.bottom, np.minimum(y[clamped], play.top))
@@ -1,19 +1,30 @@
-from pico2d import get_canvas_height, get_canvas_width, load_font, load_image
+from pico2d import get_canvas_height, get_canvas_width
 
 from common import resource_path
+import asset_loader
 from zag import Zag
 
+gui_dir = 'resource/Image/GUI'
+HP_POTION_PATH = resource_path(f'{gui_dir}/Item/hp_potion.png')
+MP_POTION_PATH = resource_path(f'{gui_dir}/Item/mp_potion.png')
+GOLD_PATH = resource_path(f'{gui_dir}/Item/bar_coin.png')
+HP_BAR_PATH = resource_path(f'{gui_dir}/hp_bar.png')
+MP_BAR_PATH = resource_path(f'{gui_dir}/mp_bar.png')
+BAR_BASE_PATH = resource_path(f'{gui_dir}/bar_base.png')
+FONT_PATH = resource_path('ENCR10B.TTF')
+
 
 class GameUI:
+    ASSETS = [HP_POTION_PATH, MP_POTION_PATH, GOLD_PATH, HP_BAR_PATH, MP_BAR_PATH, BAR_BASE_PATH]
+
     def __init__(self):
-        self.hp_potion_image = load_image(resource_path('resource/Image/GUI/Item/hp_potion.png'))
-        self.mp_potion_image = load_image(resource_path('resource/Image/GUI/Item/mp_potion.png'))
-        self.gold_image = load_image(resource_path('resource/Image/GUI/Item/bar_coin.png'))
-        gui_dir = 'resource/Image/GUI'
-        self.hp_bar_image = load_image(resource_path(f'{gui_dir}/hp_bar.png'))
-        self.mp_bar_image = load_image(resource_path(f'{gui_dir}/mp_bar.png'))
-        self.bar_base_image = load_image(resource_path(f'{gui_dir}/bar_base.png'))
-        self.font = load_font(resource_path('ENCR10B.TTF'), 30)
+        self.hp_potion_image = asset_loader.load_image(HP_POTION_PATH)
+        self.mp_potion_image = asset_loader.load_image(MP_POTION_PATH)
+        self.gold_image = asset_loader.load_image(GOLD_PATH)
+        self.hp_bar_image = asset_loader.load_image(HP_BAR_PATH)
+        self.mp_bar_image = asset_loader.load_image(MP_BAR_PATH)
+        self.bar_base_image = asset_loader.load_image(BAR_BASE_PATH)
+        self.font = asset_loader.load_font(FONT_PATH, 30)
 
     def draw(self, player):
         canvas_width, canvas_height = get_canvas_width(), get_canvas_height()
@@ -1,11 +1,13 @@
-from pico2d import get_canvas_height, load_image
+from pico2d import get_canvas_height
 from sdl2 import SDL_MOUSEBUTTONDOWN, SDL_BUTTON_LEFT
 
+import asset_loader
+
 
 class BaseIcon:
     def __init__(self, x, y, image_path, on_click=None):
         self.x, self.y = x, y
-        self.image = load_image(image_path)
+        self.image = asset_loader.load_image(image_path)
         self.w, self.h = self.image.w, self.image.h
         self.on_click = on_click if on_click is not None else (lambda: None)
 
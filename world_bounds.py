@@ -0,0 +1,45 @@
+# 월드 경계
+# 화면 크기와 월드 크기에서 나오는 영역(이동 가능 영역, 스폰 영역, 투사체 제거 경계)을 미리 계산해 둔다.
+# 엔티티는 매 프레임 get_canvas_width()/get_canvas_height() 를 부르는 대신 world.bounds 의 값을 읽는다.
+# 값은 처음 읽을 때 계산되고, 이후에는 화면 크기가 바뀌어 refresh() 를 부를 때만 다시 계산된다.
+from collections import namedtuple
+
+from pico2d import get_canvas_height, get_canvas_width
+
+# 방향 이동하는 캐릭터가 월드 가장자리에서 떨어져 있어야 하는 거리
+PLAY_MARGIN_X = 200
+PLAY_MARGIN_Y = 100
+
+Rect = namedtuple("Rect", "left bottom right top")
+
+# refresh() 가 채우는 속성
+_COMPUTED = frozenset(("view_w", "view_h", "width", "height", "world", "play", "spawn", "despawn"))
+
+
+class WorldBounds:
+    def __init__(self, size=None):
+        # size: (width, height). None 이면 화면 너비 x 화면 높이 2배
+        # 모듈 import 때 만들어지는 기본 월드는 캔버스가 열리기 전이라 여기서 크기를 묻지 않는다
+        # (pico2d 는 open_canvas 전에 get_canvas_width() 를 부르면 NameError).
+        self.size = size
+
+    def __getattr__(self, name):
+        # 아직 계산하지 않은 값을 처음 읽을 때 refresh() 한다.
+        if name not in _COMPUTED:
+            raise AttributeError(name)
+        self.refresh()
+        return self.__dict__[name]
+
+    def refresh(self):
+        # 캔버스가 열린 뒤에만 불러야 한다.
+        self.view_w = get_canvas_width()
+        self.view_h = get_canvas_height()
+        self.width, self.height = self.size or (self.view_w, self.view_h * 2)
+
+        self.world = Rect(0, 0, self.width, self.height)
+        # 방향 이동 캐릭터가 클램핑되는 영역
+        self.play = Rect(PLAY_MARGIN_X, PLAY_MARGIN_Y, self.width - PLAY_MARGIN_X, self.height - PLAY_MARGIN_Y)
+        # 일반 몬스터가 나타나는 지면 영역 (월드 전체 너비 x 화면 한 장 높이)
+        self.spawn = Rect(0, 0, self.width, self.view_h)
+        # 투사체는 이 영역에서 자기 크기 이상 벗어나면 제거된다.
+        self.despawn = self.world
@@ -2,8 +2,8 @@ from pico2d import *
 from sdl2 import SDL_KEYDOWN, SDLK_z, SDLK_SPACE, SDLK_RIGHT, SDLK_LEFT, SDLK_UP, SDLK_DOWN
 
 from common import resource_path
+import asset_loader
 import game_framework
-import game_world
 from state_machine import StateMachine
 from game_object import GameObject
 from collision_manager import CollisionGroup
@@ -16,6 +16,7 @@ from components.component_skill import SkillComponent
 from components.component_input import InputComponent
 from components.component_hud import HUDComponent
 from components.component_collision import CollisionComponent
+from fire_ball import FireBall
 
 
 def space_down(e):  # e is space down ?
@@ -49,6 +50,11 @@ IDLE_PER_TIME = 1.0 / TIME_PER_ACTION
 FRAMES_PER_ACTION = 2
 RUN_PER_TIME = 2.5 / TIME_PER_ACTION
 
+IMAGE_PATH = resource_path('resource/Image/Character/ZAG_ani.png')
+ATTACK_IMAGE_PATHS = [resource_path(f'resource/Image/Character/Attack/Attack{i}.png') for i in range(1, 8)]
+DEFEAT_IMAGE_PATH = resource_path('resource/Image/GUI/defeat.png')
+DEFEAT_BACKGROUND_PATH = resource_path('resource/Image/GUI/clearEmptyImage.png')
+
 #Attack 클래스 추가
 class Attack:
     def __init__(self, zag):
@@ -79,9 +85,8 @@ class Die:
     def __init__(self, zag):
         self.zag = zag
         self.death_timer = 2.0  # 2초 후 타이틀 화면으로 이동
-        self.defeat_image = load_image(resource_path('resource/Image/GUI/defeat.png'))
-        defeat_background_path = resource_path('resource/Image/GUI/clearEmptyImage.png')
-        self.defeat_background = load_image(defeat_background_path)
+        self.defeat_image = asset_loader.load_image(DEFEAT_IMAGE_PATH)
+        self.defeat_background = asset_loader.load_image(DEFEAT_BACKGROUND_PATH)
     def enter(self,e):
         print("Zag is Dead")
         self.zag.invincibleTimer = 0.0
@@ -93,9 +98,9 @@ class Die:
     def do(self):
         from modes import title_mode
         if self.death_timer <= 0:
-            game_world.clear()
+            self.zag.world.clear()
             game_framework.change_mode(title_mode)
-        self.death_timer -= game_framework.frame_time
+        self.death_timer -= self.zag.world.dt
     def draw(self):
         if self.death_timer > 0.5:  # 0.5초 정도 남을 때까지 DEFEAT 표시
             if self.defeat_background:
@@ -119,7 +124,7 @@ class Idle:
         pass
 
     def do(self):
-        self.zag.frame = (self.zag.frame + FRAMES_PER_ACTION * IDLE_PER_TIME * game_framework.frame_time) % 2
+        self.zag.frame = (self.zag.frame + FRAMES_PER_ACTION * IDLE_PER_TIME * self.zag.world.dt) % 2
 
     def draw(self):
         pass
@@ -136,22 +141,27 @@ class Run:
         pass
 
     def do(self):
-        self.zag.frame = (self.zag.frame + FRAMES_PER_ACTION * RUN_PER_TIME * game_framework.frame_time) % 2
+        self.zag.frame = (self.zag.frame + FRAMES_PER_ACTION * RUN_PER_TIME * self.zag.world.dt) % 2
 #composite_draw(self, left, bottom, width, height, angle, flip, x, y,w,h)
     def draw(self):
         pass
 
 class Zag(GameObject):
+    ASSETS = [
+        IMAGE_PATH,
+        *ATTACK_IMAGE_PATHS,
+        DEFEAT_IMAGE_PATH,
+        DEFEAT_BACKGROUND_PATH,
+        *HUDComponent.ASSETS,
+        *FireBall.ASSETS,
+    ]
+
     def __init__(self):
         super().__init__()
 
         self.transform = self.add_component(TransformComponent(400, 300, 48, 64))
-        image_path = resource_path('resource/Image/Character/ZAG_ani.png')
-        self.sprite = self.add_component(SpriteComponent(load_image(image_path), 32, 64))
-        attack_dir = 'resource/Image/Character/Attack'
-        self.attack_images = [
-            load_image(resource_path(f'{attack_dir}/Attack{i}.png')) for i in range(1, 8)
-        ]
+        self.sprite = self.add_component(SpriteComponent(asset_loader.load_image(IMAGE_PATH), 32, 64))
+        self.attack_images = [asset_loader.load_image(path) for path in ATTACK_IMAGE_PATHS]
         self.movement = self.add_component(MovementComponent(RUN_SPEED_PPS))
         self.combat = self.add_component(CombatComponent(100, invincible_duration=1.0, enable_invincibility=True))
         self.attack_component = self.add_component(AttackComponent(self.attack_images, duration=0.45, scale=0.7))
@@ -279,7 +289,7 @@ class Zag(GameObject):
             return
 
         if self.attack_cooldown_timer > 0:
-            self.attack_cooldown_timer -= game_framework.frame_time
+            self.attack_cooldown_timer -= self.world.dt
 
         self.state_machine.update()
         super().update()